@@ -0,0 +1,74 @@
+# --- BOARD SCALING BENCHMARK/BENCHMARK DE ESCALADO DEL TABLERO ---
+# Frame time and memory against board size, headless/Tiempo de cuadro y memoria según el tamaño del tablero, sin pantalla
+# Usage/Uso: python benchmarks/board_scaling.py [--frames N] [--sizes 4x5,10x10,...]
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # No window needed/No se necesita ventana
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # Make `src` importable/Hacer importable `src`
+
+import pygame
+from src import config
+from src import assets
+from src.game import MemoryGame
+from src.engine import FLIPPED
+
+DEFAULT_SIZES = "4x5,10x10,25x25,50x50,100x100"
+
+def surface_bytes(): # Pixel memory held by the shared face cache/Memoria de píxeles de la caché de caras
+    return assets.face_cache._faces.bytes # Tracked by the LRU/Contada por el LRU
+
+def bench(rows, cols, frames, screen):
+    config.set_grid_size(rows, cols)
+    assets.face_cache.clear()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    game = MemoryGame()
+    build_ms = (time.perf_counter() - start) * 1000
+    py_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    for slot in range(0, len(game.engine), 2): # Show half the faces so both surfaces are drawn/Mostrar la mitad de las caras para dibujar ambas superficies
+        game.engine.state[slot] = FLIPPED
+
+    start = time.perf_counter()
+    for _ in range(frames): # Full redraw every frame (worst case)/Redibujo completo en cada cuadro (peor caso)
+        screen.fill(config.GRAY)
+        game.draw(screen)
+        pygame.display.flip()
+    frame_ms = (time.perf_counter() - start) * 1000 / frames
+
+    return {
+        'board': f"{rows}x{cols}",
+        'cards': len(game.cards),
+        'build_ms': build_ms,
+        'frame_ms': frame_ms,
+        'python_kib': py_bytes / 1024,
+        'surfaces': len(assets.face_cache),
+        'surface_kib': surface_bytes() / 1024,
+    }
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--frames', type=int, default=60)
+    parser.add_argument('--sizes', default=DEFAULT_SIZES)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+
+    print(f"{'board':>9} {'cards':>6} {'build ms':>9} {'frame ms':>9} {'py KiB':>9} {'surfaces':>8} {'surf KiB':>9}")
+    for size in args.sizes.split(','):
+        rows, cols = (int(n) for n in size.split('x'))
+        r = bench(rows, cols, args.frames, screen)
+        print(f"{r['board']:>9} {r['cards']:>6} {r['build_ms']:>9.2f} {r['frame_ms']:>9.3f} "
+              f"{r['python_kib']:>9.1f} {r['surfaces']:>8} {r['surface_kib']:>9.1f}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# --- FIRST FRAME HARNESS/ARNÉS DEL PRIMER CUADRO ---
+# Shared by suite.py (cold start) and startup.py: launches run.py in a child process that exits as
+# soon as the first frame is pushed to the screen.
+# /Compartido por suite.py (arranque en frío) y startup.py: lanza run.py en un proceso hijo que sale
+# en cuanto el primer cuadro se envía a la pantalla.
+import os
+import sys
+import time
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Child process: patches the display calls before run.py imports anything of its own
+# /Proceso hijo: reemplaza las llamadas de pantalla antes de que run.py importe nada propio
+_FIRST_FRAME = """
+import os, sys, runpy
+sys.path.insert(0, {root!r})
+os.chdir({root!r})
+import pygame
+def first_frame(*args):
+    os._exit(0)
+pygame.display.flip = first_frame
+pygame.display.update = first_frame
+runpy.run_path('run.py', run_name='__main__')
+"""
+
+def child_env():
+    env = os.environ.copy()
+    env.setdefault("SDL_VIDEODRIVER", "dummy") # No window needed/No se necesita ventana
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    env.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    return env
+
+def launch(*python_args, **kwargs): # One child run to the first frame/Un arranque del hijo hasta el primer cuadro
+    code = _FIRST_FRAME.format(root=ROOT)
+    return subprocess.run([sys.executable, *python_args, '-c', code], check=True, env=child_env(), **kwargs)
+
+def time_to_first_frame(runs):
+    """Wall time in ms of each launch, interpreter start included (what a kiosk user waits for)
+    /Tiempo real en ms de cada arranque, incluido el del intérprete (lo que espera un usuario del kiosco)
+    """
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        launch()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
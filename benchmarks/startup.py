@@ -0,0 +1,82 @@
+# --- STARTUP REPORT/REPORTE DE ARRANQUE ---
+# Time from launching run.py to its first frame on screen, and where the import time goes
+# (python -X importtime, grouped by top-level package), checked against config.STARTUP_BUDGET_MS.
+# /Tiempo desde lanzar run.py hasta su primer cuadro en pantalla, y en qué se va el tiempo de importación
+# (python -X importtime, agrupado por paquete), comparado con config.STARTUP_BUDGET_MS.
+#
+# Usage/Uso:
+#   python benchmarks/startup.py                    (exit 1 over budget/sale con 1 si excede el presupuesto)
+#   python benchmarks/startup.py --budget-ms 400 --runs 10 --json
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+from first_frame import ROOT, launch, time_to_first_frame # Shared with suite.py/Compartido con suite.py
+sys.path.insert(0, ROOT) # Make `src` importable/Hacer importable `src`
+
+from src import config # Plain Python, no pygame/Python puro, sin pygame
+
+def import_times():
+    """One launch under -X importtime, returning (module, self ms, cumulative ms) in import order
+    /Un arranque con -X importtime, devolviendo (módulo, ms propios, ms acumulados) en orden de importación
+    """
+    proc = launch('-X', 'importtime', stderr=subprocess.PIPE, text=True)
+    modules = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        modules.append((name.strip(), int(self_us) / 1000, int(cumulative_us) / 1000))
+    return modules
+
+def by_package(modules): # Self time summed per top-level package/Tiempo propio sumado por paquete
+    totals = {}
+    for name, self_ms, _ in modules:
+        package = name.split('.')[0]
+        totals[package] = totals.get(package, 0.0) + self_ms
+    return dict(sorted(totals.items(), key=lambda item: -item[1]))
+
+def main():
+    parser = argparse.ArgumentParser(description="Time to first frame and import-time report for run.py")
+    parser.add_argument('--runs', type=int, default=5, help="launches to time")
+    parser.add_argument('--budget-ms', type=float, default=config.STARTUP_BUDGET_MS, help="maximum median time to first frame")
+    parser.add_argument('--top', type=int, default=15, help="slowest modules and packages to list")
+    parser.add_argument('--json', action='store_true', help="print the report as JSON")
+    args = parser.parse_args()
+
+    samples = time_to_first_frame(args.runs)
+    modules = import_times()
+    median = statistics.median(samples)
+    report = {
+        'first_frame_ms': {'median_ms': median, 'min_ms': min(samples), 'max_ms': max(samples), 'samples': len(samples)},
+        'budget_ms': args.budget_ms,
+        'import_ms': sum(self_ms for _, self_ms, _ in modules),
+        'packages': dict(list(by_package(modules).items())[:args.top]),
+        'modules': [{'module': name, 'self_ms': self_ms, 'cumulative_ms': cumulative_ms}
+                    for name, self_ms, cumulative_ms in sorted(modules, key=lambda m: -m[1])[:args.top]],
+        'game_modules': [name for name, _, _ in modules if name.split('.')[0] == 'src'], # What the first frame needed/Lo que necesitó el primer cuadro
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"first frame: {median:.1f} ms median ({min(samples):.1f}-{max(samples):.1f}, {len(samples)} runs), "
+              f"budget {args.budget_ms:.0f} ms")
+        print(f"imports: {report['import_ms']:.1f} ms (self time, measured separately under -X importtime)")
+        print("by package/por paquete:")
+        for package, ms in report['packages'].items():
+            print(f"  {ms:8.1f} ms  {package}")
+        print("slowest modules/módulos más lentos:")
+        for entry in report['modules']:
+            print(f"  {entry['self_ms']:8.1f} ms  {entry['module']} ({entry['cumulative_ms']:.1f} ms cumulative)")
+        print("game modules before the first frame/módulos del juego antes del primer cuadro:")
+        print("  " + ", ".join(report['game_modules']))
+
+    if median > args.budget_ms:
+        print(f"OVER BUDGET: first frame {median:.1f} ms > {args.budget_ms:.0f} ms", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+# --- BENCHMARK SUITE/SUITE DE BENCHMARKS ---
+# Startup, game construction, frame time per state and click latency, headless, as JSON.
+# /Arranque, construcción del juego, tiempo de cuadro por estado y latencia de clic, sin pantalla, en JSON.
+#
+# Usage/Uso:
+#   python benchmarks/suite.py --output results.json
+#   python benchmarks/suite.py --baseline baseline.json --tolerance 0.25   (exit 1 on regressions/sale con 1 si hay regresiones)
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import statistics
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # No window needed/No se necesita ventana
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT) # Make `src` importable/Hacer importable `src`
+
+import pygame
+from src import config
+from src import assets
+from src import fonts
+from src.texts import text_cache
+from src import main as game_main
+from src.game import MemoryGame
+from src.profiler import percentile
+from first_frame import time_to_first_frame # Shared with startup.py/Compartido con startup.py
+
+def stats(samples_ms): # Summary of timing samples in ms/Resumen de muestras de tiempo en ms
+    return {
+        'median_ms': statistics.median(samples_ms),
+        'p99_ms': percentile(samples_ms, 99),
+        'samples': len(samples_ms),
+    }
+
+
+# --- 1. COLD START/ARRANQUE EN FRÍO ---
+def bench_cold_start(runs): # run.py to its first frame on screen/run.py hasta su primer cuadro en pantalla
+    return stats(time_to_first_frame(runs))
+
+
+# --- 2. GAME CONSTRUCTION/CONSTRUCCIÓN DEL JUEGO ---
+def bench_construction(runs):
+    assets.face_cache.clear() # First game renders every face/El primer juego renderiza todas las caras
+    start = time.perf_counter()
+    MemoryGame()
+    cold = (time.perf_counter() - start) * 1000
+
+    samples = []
+    for _ in range(runs): # Later games borrow the cached faces/Los juegos siguientes usan las caras en caché
+        start = time.perf_counter()
+        MemoryGame()
+        samples.append((time.perf_counter() - start) * 1000)
+    result = stats(samples)
+    result['cold_ms'] = cold
+    return result
+
+
+# --- 3. FRAME TIME PER STATE/TIEMPO DE CUADRO POR ESTADO ---
+def bench_frames(frames, dirty_rects):
+    """Run the real main() loop uncapped with scripted events, timing each frame per state
+    /Ejecutar el bucle real de main() sin límite con eventos programados, midiendo cada cuadro por estado
+    """
+    saved = (config.FPS, config.EVENT_DRIVEN, config.DIRTY_RECTS)
+    config.FPS = 0 # clock.tick(0) never sleeps/clock.tick(0) nunca duerme
+    config.EVENT_DRIVEN = False # Poll so every iteration is a frame/Sondear para que cada iteración sea un cuadro
+    config.DIRTY_RECTS = dirty_rects
+
+    real_get = pygame.event.get
+    times = {'MENU': [], 'GAME': [], 'WIN': []}
+    script = {'frame': 0, 'last': None, 'state': None}
+
+    def scripted_get(*args, **kwargs):
+        real_get() # Keep SDL pumping/Mantener SDL procesando eventos
+        now = time.perf_counter()
+        if script['last'] is not None:
+            times[script['state']].append((now - script['last']) * 1000)
+        script['last'] = now
+        script['state'] = game_main.current_state
+        script['frame'] += 1
+        frame = script['frame']
+
+        if frame == frames: # Leave the menu through the start button/Salir del menú por el botón de inicio
+            btn = next(b for b in game_main_menu_buttons() if b.text_key == 'start')
+            return [pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=btn.rect.center)]
+        if frame == 2 * frames: # Instant win/Victoria instantánea
+            game_main.game.pairs_found = config.TOTAL_PAIRS
+        if frame >= 3 * frames:
+            return [pygame.event.Event(pygame.QUIT)]
+        return []
+
+    captured = {}
+    real_menu = game_main.MainMenu
+    def capture_menu(*args, **kwargs): # Keep a handle on the menu built by main()/Guardar el menú creado por main()
+        captured['menu'] = real_menu(*args, **kwargs)
+        return captured['menu']
+    def game_main_menu_buttons():
+        return captured['menu'].buttons
+
+    pygame.event.get = scripted_get
+    game_main.MainMenu = capture_menu
+    game_main.current_state = "MENU"
+    try:
+        game_main.main()
+    finally:
+        pygame.event.get = real_get
+        game_main.MainMenu = real_menu
+        config.FPS, config.EVENT_DRIVEN, config.DIRTY_RECTS = saved
+        fonts.clear() # main() quit pygame, so the fonts are gone/main() cerró pygame, así que las fuentes ya no sirven
+        assets.face_cache.clear()
+        text_cache.clear()
+
+    return {state: stats(samples[1:] or samples) for state, samples in times.items()} # Skip each state's first (full) frame/Omitir el primer cuadro (completo) de cada estado
+
+
+# --- 4. CLICK LATENCY/LATENCIA DE CLIC ---
+def bench_clicks(sizes, clicks):
+    results = {}
+    saved = (config.GRID_ROWS, config.GRID_COLS)
+    rng = random.Random(0)
+    for rows, cols in sizes:
+        config.set_grid_size(rows, cols)
+        game = MemoryGame(seed=0)
+        engine = game.engine
+        positions = [rng.choice(game.cards).rect.center for _ in range(clicks)]
+
+        samples = []
+        for pos in positions:
+            start = time.perf_counter_ns()
+            game.handle_click(pos)
+            samples.append((time.perf_counter_ns() - start) / 1e6)
+            if engine.block_input: # Skip the flip-back delay/Saltar el retraso de volteo
+                engine.update(engine.deadline())
+        pygame.time.set_timer(game_main.FLIP_BACK_EVENT, 0) # Cancel pending timers/Cancelar temporizadores pendientes
+        results[f"{rows}x{cols}"] = stats(samples)
+    config.set_grid_size(*saved)
+    return results
+
+
+# --- RUN AND COMPARE/EJECUTAR Y COMPARAR ---
+def flatten(results, metrics, prefix=''): # {'a': {'median_ms': 1}} -> {'a.median_ms': 1}
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, metrics, name + '.'))
+        elif key in metrics:
+            flat[name] = value
+    return flat
+
+def compare(results, baseline, tolerance, min_delta_ms, metrics=('median_ms', 'cold_ms')):
+    """List the timings slower than the baseline by more than the tolerance
+    (and by at least min_delta_ms, so microsecond noise does not fail the run)
+    /Listar los tiempos más lentos que la línea base por encima de la tolerancia
+    (y por al menos min_delta_ms, para que el ruido de microsegundos no falle la ejecución)
+    """
+    current = flatten(results, metrics)
+    regressions = []
+    for name, base in flatten(baseline.get('results', baseline), metrics).items():
+        value = current.get(name)
+        if value is None or base <= 0:
+            continue
+        if value > base * (1 + tolerance) and value - base >= min_delta_ms:
+            regressions.append((name, base, value))
+    return regressions
+
+def open_display():
+    pygame.init()
+    pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+
+def run(args):
+    results = {}
+    if not args.skip_cold_start:
+        results['cold_start'] = bench_cold_start(args.runs)
+
+    open_display()
+    results['construction'] = bench_construction(args.runs * 4)
+    results['frames_full'] = bench_frames(args.frames, dirty_rects=False)
+    results['frames_dirty'] = bench_frames(args.frames, dirty_rects=True)
+    open_display() # main() quits pygame on exit/main() cierra pygame al salir
+    sizes = [tuple(int(n) for n in size.split('x')) for size in args.sizes.split(',')]
+    results['click'] = bench_clicks(sizes, args.clicks)
+    pygame.quit()
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless benchmarks for the memory game")
+    parser.add_argument('--output', help="write the results JSON to this file")
+    parser.add_argument('--baseline', help="compare against a previous results JSON")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed slowdown vs the baseline (0.25 = 25%%)")
+    parser.add_argument('--min-delta-ms', type=float, default=0.05, help="ignore slowdowns smaller than this")
+    parser.add_argument('--metrics', default='median_ms,cold_ms', help="timings compared against the baseline (p99_ms is noisy)")
+    parser.add_argument('--runs', type=int, default=5, help="cold starts to time")
+    parser.add_argument('--frames', type=int, default=120, help="frames per state")
+    parser.add_argument('--clicks', type=int, default=2000, help="clicks per board size")
+    parser.add_argument('--sizes', default="4x5,20x20,100x100", help="board sizes for click latency")
+    parser.add_argument('--skip-cold-start', action='store_true')
+    args = parser.parse_args()
+
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'platform': platform.platform(),
+            'video_driver': os.environ.get("SDL_VIDEODRIVER"),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': run(args),
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    print(text)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(report['results'], baseline, args.tolerance, args.min_delta_ms, args.metrics.split(','))
+        for name, base, value in regressions:
+            print(f"REGRESSION {name}: {base:.3f} ms -> {value:.3f} ms", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.tolerance:.0%} of {args.baseline}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import pygame
+from . import config
+
+# --- FLIP ANIMATION FRAMES/CUADROS DE LA ANIMACIÓN DE VOLTEO ---
+# A flip squashes the old image to a sliver and widens the new one back to full width. The squashed
+# frames of each face and of the back are scaled once and shared by every card, so an animating card
+# costs one blit per frame. The cache holds one card size: asking for another size (a new board)
+# evicts it.
+# /Un volteo aplasta la imagen anterior hasta una franja y ensancha la nueva hasta el ancho completo.
+# Los cuadros aplastados de cada cara y del reverso se escalan una vez y se comparten entre cartas,
+# así una carta animada cuesta un blit por cuadro. La caché guarda un tamaño de carta: pedir otro
+# tamaño (un tablero nuevo) la vacía.
+
+class FlipFrames:
+    def __init__(self, steps=None):
+        self.steps = steps or config.FLIP_STEPS # Frames per half flip/Cuadros por medio volteo
+        self.size = None # Card size of the cached frames/Tamaño de carta de los cuadros guardados
+        self._frames = {} # Surface -> [full, ..., narrowest]/Superficie -> [completa, ..., más angosta]
+
+    def frames(self, surface):
+        """Squashed versions of a face, from full width down to a sliver, built on first use (main thread only)
+        /Versiones aplastadas de una cara, del ancho completo a una franja, creadas en el primer uso (solo hilo principal)
+        """
+        frames = self._frames.get(surface)
+        if frames is None:
+            width, height = surface.get_size()
+            if (width, height) != self.size: # A different board: drop the old frames/Otro tablero: descartar los cuadros anteriores
+                self._frames.clear()
+                self.size = (width, height)
+            frames = [surface] # Step 0 is the face itself/El paso 0 es la propia cara
+            for step in range(1, self.steps):
+                frame = pygame.Surface((width, height))
+                frame.fill(config.GRAY) # Table color around the squashed card/Color de la mesa alrededor de la carta aplastada
+                squashed = pygame.transform.smoothscale(surface, (max(1, width * (self.steps - step) // self.steps), height))
+                frame.blit(squashed, squashed.get_rect(center=(width // 2, height // 2)))
+                if pygame.display.get_surface() is not None: # Opaque and in display format: one fast blit/Opaco y en formato de pantalla: un blit rápido
+                    frame = frame.convert()
+                frames.append(frame)
+            self._frames[surface] = frames
+        return frames
+
+    def frame(self, old, new, progress):
+        """Image of a flip from old to new at progress in [0, 1)
+        /Imagen de un volteo de old a new con progreso en [0, 1)
+        """
+        step = int(progress * 2 * self.steps)
+        if step < self.steps: # First half: the old image narrows/Primera mitad: la imagen anterior se angosta
+            return self.frames(old)[step]
+        return self.frames(new)[2 * self.steps - 1 - step] # Second half: the new image widens/Segunda mitad: la nueva se ensancha
+
+    def warm(self, surfaces): # Build the frames ahead of time (main thread only)/Crear los cuadros por adelantado (solo hilo principal)
+        for surface in surfaces:
+            self.frames(surface)
+
+    def clear(self):
+        self._frames.clear()
+        self.size = None
+
+    def __len__(self):
+        return len(self._frames)
+
+
+flip_frames = FlipFrames() # Shared by every card and game/Compartido por todas las cartas y juegos
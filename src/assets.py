@@ -0,0 +1,159 @@
+import os
+import threading
+import contextlib
+import pygame
+from . import config
+from . import fonts
+from . import bundle
+from .texts import text_cache
+from .lru import SurfaceLRU
+
+# --- CARD FACE CACHE/CACHÉ DE CARAS DE CARTAS ---
+
+def symbol_size(width, height): # Size of the symbol inside a card/Tamaño del símbolo dentro de una carta
+    pad = min(20, width // 5, height // 5) # Smaller margin on tiny cards/Margen menor en cartas pequeñas
+    return max(1, width - pad), max(1, height - pad)
+
+def face_font_scale(width, height):
+    """Font scale for text faces: 1 on the 800x600 board, larger on big cards, in quarter steps
+    /Escala de fuente de las caras de texto: 1 en el tablero de 800x600, mayor en cartas grandes, en pasos de un cuarto
+    """
+    return max(1.0, int(min(width / 142, height / 116) * 4) / 4) # 142x116 is the 4x5 card at 800x600/142x116 es la carta 4x5 a 800x600
+
+_sources = {} # Decoded symbol PNGs, so a resize only rescales/PNG de símbolos decodificados, así un redimensionado solo reescala
+
+def load_symbol(pair_id, size):
+    """Load a symbol scaled to size: from the packed bundle if there is one, else from symbol_N.png, or None
+    /Cargar un símbolo escalado: del paquete si existe, si no de symbol_N.png, o None
+    """
+    packed = bundle.get_bundle()
+    if packed is not None:
+        img = packed.symbol(pair_id, size) # No file open, no PNG decode/Sin abrir archivos ni decodificar PNG
+        if img is not None:
+            return img
+
+    img = _sources.get(pair_id)
+    if img is None:
+        filename = f"symbol_{pair_id}.png"# Image file name based on pair_id/Nombre del archivo de imagen basado en pair_id
+        relative_path = os.path.join(config.ASSETS_DIR, filename) # Relative path to the image/Ruta relativa a la imagen
+        full_path = config.get_path(relative_path) # Get the full path to the image/Obtener la ruta completa a la imagen
+        if not os.path.exists(full_path): # Check if the image file exists/Verificar si el archivo de imagen existe
+            return None
+        img = pygame.image.load(full_path).convert_alpha() # Load the image with transparency/Cargar la imagen con transparencia
+        _sources[pair_id] = img
+    # Smoothscale looks better for resizing/Smoothscale se ve mejor para redimensionar
+    return pygame.transform.smoothscale(img, size)
+
+
+def render_face(pair_id, kind, width, height, language=None):
+    """
+    Render a card face based on its kind (text cards in the given or current language)./Renderizar la cara de una carta según su tipo (las de texto en el idioma dado o el actual).
+    """
+    surf = pygame.Surface((width, height)) # Start with a blank surface/Comenzar con una superficie en blanco
+    surf.fill(config.WHITE) # Card background color/Color de fondo de la carta
+    pygame.draw.rect(surf, config.BLACK, (0, 0, width, height), 3) # Card border/Dibujo del borde de la carta
+
+    # A) Text card / Carta de texto
+    if kind == 'text':
+        name = config.get_component_name(pair_id, language)# Get the name in the card's language/Obtener el nombre en el idioma de la carta
+        font_size = 18 if len(name) <= 8 else 15 # Dynamic font size based on text length/Tamaño de fuente dinámico según la longitud del texto
+        font_size = round(font_size * face_font_scale(width, height)) # Bigger on big cards/Más grande en cartas grandes
+        font = (config.FONT_FAMILY, font_size, True) # Use a bold font for better readability/Usar una fuente en negrita para mejor legibilidad
+        text_surf = text_cache.component(pair_id, font, config.BLACK, language) # Shared with every card size/Compartido con todos los tamaños de carta
+        text_rect = text_surf.get_rect(center=(width//2, height//2)) # Center the text/Centrar el texto
+        surf.blit(text_surf, text_rect)# Draw the text onto the card/Dibujar el texto en la carta
+
+    # B) Symbol card / Carta de símbolo
+    elif kind == 'symbol':
+        img = load_symbol(pair_id, symbol_size(width, height)) # From the bundle or the PNG/Del paquete o del PNG
+        if img is not None:
+            img_rect = img.get_rect(center=(width//2, height//2)) # Center the image/Centrar la imagen
+            surf.blit(img, img_rect) # Draw the image onto the card/Dibujar la imagen en la carta
+        else:
+            # Fallback if image is missing/Alternativa si falta la imagen
+            font = fonts.get_font(config.FONT_FAMILY, 20, bold=True)
+            text_surf = font.render("Image Missing", True, config.RED)
+            text_rect = text_surf.get_rect(center=(width//2, height//2))
+            surf.blit(text_surf, text_rect)
+
+    if pygame.display.get_surface() is not None: # Match the display pixel format for fast blits/Igualar el formato de píxeles de la pantalla para blits rápidos
+        surf = surf.convert()
+    return surf # Return the pre-rendered card surface/Devolver la superficie de la carta pre-renderizada
+
+def render_back(width, height): # Render the card back shared by every face-down card/Renderizar el reverso compartido por todas las cartas boca abajo
+    surf = pygame.Surface((width, height))
+    surf.fill(config.INDIGO) # Card back color/Color del reverso de la carta
+    pygame.draw.rect(surf, config.BLACK, (0, 0, width, height), 2) # Card back border/Borde del reverso de la carta
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert()
+    return surf
+
+
+class FaceCache: # Process-wide store of rendered card faces shared by every game/Almacén global de caras renderizadas compartido por todos los juegos
+    def __init__(self, max_size=config.FACE_CACHE_SIZE, max_bytes=config.FACE_CACHE_BYTES):
+        self.max_size = max_size # Maximum number of faces kept alive/Número máximo de caras que se conservan
+        self._faces = SurfaceLRU(max_size, max_bytes) # Keyed by card size too, so resizing back is a hit/También por tamaño de carta, así volver a un tamaño es un acierto
+        self.hits = 0 # Lookups served from the cache/Búsquedas atendidas desde la caché
+        self.misses = 0 # Lookups that had to render/Búsquedas que tuvieron que renderizar
+        self._lock = threading.Lock() # Games may be built on the prefetch thread/Los juegos pueden crearse en el hilo de precarga
+        self._local = threading.local() # Per-thread lookup_only() flag/Bandera de lookup_only() por hilo
+
+    def get(self, pair_id, kind, width, height, language=None):
+        """Get the shared face for a card (in the given or current language), rendering it on first use
+        /Obtener la cara compartida de una carta (en el idioma dado o el actual), renderizándola en el primer uso
+        """
+        language = (language or config.LANGUAGE) if kind == 'text' else None # Symbols look the same in every language/Los símbolos se ven igual en todos los idiomas
+        key = (pair_id, kind, (width, height), language)
+        return self._lookup(key, render_face, pair_id, kind, width, height, language)
+
+    def get_back(self, width, height): # Get the shared card back for a card size/Obtener el reverso compartido para un tamaño de carta
+        return self._lookup(('back', (width, height)), render_back, width, height)
+
+    def warm(self, width, height, pairs, languages=None):
+        """Render every face and the back for a card size ahead of time (main thread only)
+        languages: text faces to render (default: the current language)
+        /Renderizar de antemano todas las caras y el reverso para un tamaño de carta (solo hilo principal)
+        languages: caras de texto a renderizar (por defecto: el idioma actual)
+        """
+        for pair_id in range(min(pairs, config.FACE_POOL_SIZE)):
+            self.get(pair_id, 'symbol', width, height)
+            for language in languages or (config.LANGUAGE,):
+                self.get(pair_id, 'text', width, height, language)
+        self.get_back(width, height)
+
+    @contextlib.contextmanager
+    def lookup_only(self):
+        """Within this block the calling thread never renders: a miss raises LookupError
+        (fonts, smoothscale and convert() are main-thread work)
+        /Dentro de este bloque el hilo que llama nunca renderiza: un fallo lanza LookupError
+        (las fuentes, smoothscale y convert() son trabajo del hilo principal)
+        """
+        self._local.lookup_only = True
+        try:
+            yield
+        finally:
+            self._local.lookup_only = False
+
+    def _lookup(self, key, render, *args): # Return a cached surface or render and store it/Devolver una superficie en caché o renderizarla y guardarla
+        with self._lock:
+            surf = self._faces.get(key) # Marks it as recently used/La marca como usada recientemente
+            if surf is not None:
+                self.hits += 1
+                return surf
+
+        if getattr(self._local, 'lookup_only', False): # E.g. evicted by a resize while the prefetch thread was building/P. ej. desalojada por un redimensionado mientras el hilo de precarga construía
+            raise LookupError(f"face not cached: {key}")
+        self.misses += 1
+        surf = render(*args)
+        with self._lock:
+            self._faces.put(key, surf) # Evicts the oldest faces past the count or memory bound/Desaloja las caras más antiguas que exceden el límite
+        return surf
+
+    def clear(self): # Drop every cached face (e.g. after the display is recreated)/Descartar todas las caras (p. ej. tras recrear la pantalla)
+        self._faces.clear()
+
+    def __len__(self):
+        return len(self._faces)
+
+
+face_cache = FaceCache() # Shared instance used by Card/Instancia compartida usada por Card
@@ -0,0 +1,195 @@
+# --- PACKED ASSET BUNDLE/PAQUETE DE RECURSOS ---
+# All symbols in one file: a JSON index plus raw RGBA pixels, optionally pre-scaled for common card
+# sizes. The runtime maps the file once and builds surfaces straight from the buffer, no PNG decoding.
+# /Todos los símbolos en un archivo: un índice JSON más píxeles RGBA crudos, opcionalmente
+# pre-escalados para tamaños de carta comunes. Se mapea una vez y se crean superficies del búfer.
+#
+# Build/Construir: python -m src.bundle build [--sizes 145x116,...]
+# Layout/Formato: header (magic, version, index length) | JSON index | pixel blobs
+# The index records each source PNG's size and SHA-256. At startup a loose PNG with another size (or a
+# new one) makes the game ignore the bundle; `check` compares the hashes. Copies and PyInstaller keep
+# the bundle valid, and a bundle-only install (no loose PNGs) is never stale.
+# /El índice guarda el tamaño y el SHA-256 de cada PNG fuente. Al arrancar, un PNG suelto con otro
+# tamaño (o uno nuevo) hace que se ignore el paquete; `check` compara los hashes. Las copias y
+# PyInstaller no lo invalidan, y una instalación solo con el paquete (sin PNG sueltos) nunca es vieja.
+#
+# Check/Comprobar: python -m src.bundle check   (exit 1 if out of date/sale con 1 si está desactualizado)
+import os
+import sys
+import json
+import hashlib
+import mmap
+import struct
+import pygame
+from . import config
+
+MAGIC = b'EMGB'
+VERSION = 3 # 3: sources are recorded by size and hash/3: las fuentes se registran por tamaño y hash
+HEADER = struct.Struct('<4sHHI') # magic, version, reserved, index length/magia, versión, reservado, largo del índice
+
+
+class Bundle: # A memory-mapped bundle file/Un archivo de paquete mapeado en memoria
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) # One mapping, pages load on demand/Un solo mapeo, las páginas se cargan bajo demanda
+        magic, version, _, index_len = HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a symbol bundle (version {VERSION}): {path}")
+        start = HEADER.size
+        self.index = json.loads(bytes(self._data[start:start + index_len]).decode('utf-8'))
+        self._base = start + index_len # Offsets in the index are relative to the pixel data/Los offsets son relativos a los píxeles
+
+    def _surface(self, entry): # Wrap an entry's pixels in a Surface without copying/Envolver los píxeles de una entrada en una Surface sin copiar
+        start = self._base + entry['offset']
+        view = memoryview(self._data)[start:start + entry['length']]
+        return pygame.image.frombuffer(view, tuple(entry['size']), 'RGBA')
+
+    def symbol(self, pair_id, size):
+        """Get the symbol at a size: the pre-scaled copy if there is one, else the scaled source, or None
+        /Obtener el símbolo a un tamaño: la copia pre-escalada si existe, si no la fuente escalada, o None
+        """
+        entry = self.index['scaled'].get(f"{pair_id}@{size[0]}x{size[1]}")
+        if entry is not None: # Already at the right size/Ya tiene el tamaño correcto
+            return self._surface(entry)
+        entry = self.index['symbols'].get(str(pair_id))
+        if entry is None:
+            return None
+        return pygame.transform.smoothscale(self._surface(entry), size)
+
+    def stale(self, strict=False):
+        """List the loose symbol PNGs that differ from the ones the bundle was built from (missing ones do not count)
+        /Listar los PNG sueltos que difieren de los usados para construir el paquete (los que faltan no cuentan)
+
+        strict: compare the content hashes too, not only the sizes/comparar también los hashes, no solo los tamaños
+        """
+        recorded = self.index.get('sources', {})
+        changed = []
+        for name, path in source_files().items():
+            entry = recorded.get(name)
+            if entry is None or os.path.getsize(path) != entry['size'] or (strict and file_hash(path) != entry['sha256']):
+                changed.append(name)
+        return changed
+
+
+def source_files(): # Path of every symbol PNG present, keyed by file name/Ruta de cada PNG de símbolo presente, por nombre
+    files = {}
+    for pair_id in range(config.FACE_POOL_SIZE):
+        name = f"symbol_{pair_id}.png"
+        path = os.path.join(config.ASSETS_DIR, name)
+        if os.path.isfile(path):
+            files[name] = path
+    return files
+
+def file_hash(path): # SHA-256 of a file's bytes/SHA-256 de los bytes de un archivo
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+_bundle = None # Loaded bundle, False once we know there is none/Paquete cargado, False si no hay ninguno
+
+def get_bundle():
+    """Open config.BUNDLE_PATH once per process, or None if it is missing or invalid
+    /Abrir config.BUNDLE_PATH una vez por proceso, o None si falta o no es válido
+    """
+    global _bundle
+    if _bundle is None:
+        path = config.get_path(config.BUNDLE_PATH)
+        try:
+            _bundle = Bundle(path)
+        except (OSError, ValueError): # Fall back to the loose PNGs/Volver a los PNG sueltos
+            _bundle = False
+        else:
+            changed = _bundle.stale()
+            if changed: # Resized or added symbols win over an old bundle/Los símbolos cambiados o nuevos ganan a un paquete viejo
+                print(f"Symbol bundle is out of date ({', '.join(changed)} changed), using the PNGs; "
+                      f"rebuild it with `python -m src.bundle build`", file=sys.stderr)
+                _bundle = False
+    return _bundle or None
+
+
+# --- BUILD STEP/PASO DE CONSTRUCCIÓN ---
+
+def default_sizes(): # Symbol size on the configured board/Tamaño del símbolo en el tablero configurado
+    from .game import grid_layout
+    from .assets import symbol_size
+    layout = grid_layout(config.SCREEN_WIDTH, config.SCREEN_HEIGHT, config.GRID_ROWS, config.GRID_COLS)
+    return [symbol_size(layout.cell_width, layout.cell_height)]
+
+def build(path=None, sizes=None, source_max=None):
+    """Pack every symbol_N.png into one bundle file
+    /Empaquetar todos los symbol_N.png en un solo archivo
+
+    sizes: symbol sizes to pre-scale (default: the configured board)/tamaños a pre-escalar (por defecto: el tablero configurado)
+    source_max: shrink the unscaled sources to fit this box (default: native size, so large cards stay sharp)
+                /reducir las fuentes sin escalar a esta caja (por defecto: tamaño original, así las cartas grandes siguen nítidas)
+    """
+    path = path or config.BUNDLE_PATH
+    sizes = default_sizes() if sizes is None else sizes
+    sources = {name: {'size': os.path.getsize(png), 'sha256': file_hash(png)} for name, png in source_files().items()}
+    index = {'symbols': {}, 'scaled': {}, 'sources': sources}
+    blobs = []
+    offset = 0
+
+    def add(table, key, surf): # Append a surface's pixels and index them/Agregar los píxeles de una superficie e indexarlos
+        nonlocal offset
+        data = pygame.image.tobytes(surf, 'RGBA')
+        table[key] = {'size': list(surf.get_size()), 'offset': offset, 'length': len(data)}
+        blobs.append(data)
+        offset += len(data)
+
+    for pair_id in range(config.FACE_POOL_SIZE):
+        png = os.path.join(config.ASSETS_DIR, f"symbol_{pair_id}.png")
+        if not os.path.exists(png):
+            continue
+        img = pygame.image.load(png)
+        w, h = img.get_size()
+        scale = min(1.0, source_max / max(w, h)) if source_max else 1.0
+        source = pygame.transform.smoothscale(img, (max(1, int(w * scale)), max(1, int(h * scale)))) if scale < 1 else img
+        add(index['symbols'], str(pair_id), source)
+        for size in sizes: # Same smoothscale the runtime would do/El mismo smoothscale que haría el juego
+            add(index['scaled'], f"{pair_id}@{size[0]}x{size[1]}", pygame.transform.smoothscale(img, size))
+
+    index_bytes = json.dumps(index, separators=(',', ':')).encode('utf-8')
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(index_bytes)))
+        f.write(index_bytes)
+        for data in blobs:
+            f.write(data)
+    os.replace(tmp, path) # Never leave a half-written bundle/Nunca dejar un paquete a medio escribir
+    return path, len(index['symbols']), len(index['scaled'])
+
+
+def main():
+    import argparse # Command line only/Solo para la línea de comandos
+    parser = argparse.ArgumentParser(description="Build or inspect the packed symbol bundle")
+    sub = parser.add_subparsers(dest='command', required=True)
+    b = sub.add_parser('build')
+    b.add_argument('--output', default=config.BUNDLE_PATH)
+    b.add_argument('--sizes', help="symbol sizes to pre-scale, e.g. 125x96,60x40")
+    b.add_argument('--source-max', type=int, help="shrink the unscaled sources to fit this box (default: native size)")
+    i = sub.add_parser('info')
+    i.add_argument('path', nargs='?', default=config.BUNDLE_PATH)
+    c = sub.add_parser('check', help="compare the bundle with the symbol PNGs by content hash")
+    c.add_argument('path', nargs='?', default=config.BUNDLE_PATH)
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        sizes = None
+        if args.sizes:
+            sizes = [tuple(int(n) for n in size.split('x')) for size in args.sizes.split(',')]
+        path, symbols, scaled = build(args.output, sizes, args.source_max)
+        print(f"{path}: {symbols} symbols, {scaled} pre-scaled, {os.path.getsize(path)} bytes")
+    elif args.command == 'check':
+        changed = Bundle(args.path).stale(strict=True)
+        if changed:
+            print(f"{args.path} is out of date: {', '.join(changed)} changed", file=sys.stderr)
+            sys.exit(1)
+        print(f"{args.path} is up to date")
+    else:
+        bundle = Bundle(args.path)
+        json.dump(bundle.index, sys.stdout, indent=2)
+        print()
+
+if __name__ == "__main__":
+    main()
@@ -14,15 +14,30 @@ def get_path(relative_path):
     
     return os.path.join(base_path, relative_path)
 # --- 1. SCREEN SETTINGS/CONFIGURACIÓN DE PANTALLA ---
-SCREEN_WIDTH = 800 # Ancho de pantalla
+SCREEN_WIDTH = 800 # Ancho de pantalla (current window, see set_screen_size/ventana actual, ver set_screen_size)
 SCREEN_HEIGHT = 600 # Altura de pantalla
+BASE_WIDTH = 800 # Design size the UI coordinates refer to/Tamaño de diseño al que se refieren las coordenadas de la interfaz
+BASE_HEIGHT = 600
+RESIZABLE = True # Let the window be resized; the layout follows/Permitir redimensionar la ventana; la disposición la sigue
+FULLSCREEN = False # Start in fullscreen (F11 toggles)/Iniciar en pantalla completa (F11 alterna)
 FPS = 60 # Cuadros por segundo
+DIRTY_RECTS = True # Only push the screen areas that changed/Solo actualizar las áreas de la pantalla que cambiaron
+EVENT_DRIVEN = True # Sleep until an event or timer arrives instead of polling at FPS/Dormir hasta que llegue un evento o temporizador en vez de sondear a FPS
+PREFETCH_GAMES = True # Prepare the next board on a worker thread while the menu or win screen shows/Preparar el siguiente tablero en un hilo mientras se muestra el menú o la victoria
+PROFILE = False # Time every frame phase, F3 shows the overlay, stats are written on exit (or set MEMORY_PROFILE=1)/Medir cada fase del cuadro, F3 muestra la superposición, se guardan al salir (o MEMORY_PROFILE=1)
+PROFILE_SAMPLES = 600 # Frames kept by the profiler (10 s at 60 FPS)/Cuadros guardados por el perfilador (10 s a 60 FPS)
+STARTUP_BUDGET_MS = 1000 # Max time from launch to the first menu frame, checked by benchmarks/startup.py/Tiempo máximo desde el arranque hasta el primer cuadro del menú, verificado por benchmarks/startup.py
 
 # --- 2. GRID SETTINGS/CONFIGURACIÓN DE LA CUADRÍCULA ---
 GRID_ROWS = 4 # Filas de la cuadrícula
 GRID_COLS = 5 # columnas de la cuadrícula
 CARD_GAP = 15  # Gap between cards/Espacio entre cartas
 TOTAL_PAIRS = (GRID_ROWS * GRID_COLS) // 2 #Total pairs in the game/Total de pares en el juego
+FACE_POOL_SIZE = 10 # Distinct faces (symbol_N.png and component names); bigger boards reuse them/Caras distintas (symbol_N.png y nombres); los tableros grandes las reutilizan
+MISMATCH_DELAY = 1000 # Milliseconds before mismatched cards flip back/Milisegundos antes de que las cartas no coincidentes se volteen
+FLIP_ANIMATION = True # Animate cards turning over/Animar las cartas al voltearse
+FLIP_DURATION = 240 # Milliseconds per flip/Milisegundos por volteo
+FLIP_STEPS = 6 # Pre-scaled frames per half flip/Cuadros pre-escalados por medio volteo
 # --- 3. COLORS/COLORES ---
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -37,6 +52,20 @@ VIOLET = (148, 0, 211)
 # Get the parent directory of the current file/ Obtener el directorio padre del archivo actual
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) 
 ASSETS_DIR = os.path.join(BASE_DIR, 'assets')
+FACE_CACHE_SIZE = 64 # Max card faces kept in memory across games/Máximo de caras de cartas guardadas en memoria entre juegos
+FACE_CACHE_BYTES = 128 * 1024 * 1024 # Memory cap for cached faces and backs (4K cards are ~1.5 MB each)/Límite de memoria para caras y reversos (las cartas 4K ocupan ~1.5 MB)
+TEXT_CACHE_BYTES = 16 * 1024 * 1024 # Memory cap for rendered texts/Límite de memoria para textos renderizados
+BUNDLE_PATH = os.path.join(ASSETS_DIR, 'symbols.bundle') # Packed symbols built with `python -m src.bundle build`/Símbolos empaquetados
+
+# --- 4.1 FONT SETTINGS/CONFIGURACIÓN DE FUENTES ---
+FONT_FAMILY = 'Arial' # Family used by every text in the game/Familia usada por todos los textos del juego
+PRELOAD_FONTS = True # Resolve the fonts below at startup/Resolver las fuentes de abajo al iniciar
+PRELOAD_TEXT = True # Render the UI texts in every language at startup, so switching never renders/Renderizar los textos en todos los idiomas al iniciar, así cambiar nunca renderiza
+FONT_PRELOAD = [ # (family, size, bold) used by the UI and the cards/(familia, tamaño, negrita) usadas por la interfaz y las cartas
+    (FONT_FAMILY, 15, True), (FONT_FAMILY, 18, True), (FONT_FAMILY, 20, True), # Card faces/Caras de las cartas
+    (FONT_FAMILY, 24, True), # Buttons and score/Botones y puntuación
+    (FONT_FAMILY, 16, False), (FONT_FAMILY, 60, False), (FONT_FAMILY, 80, False), # Labels/Etiquetas
+]
 
 # --- 5. LANGUAGE SETTINGS/CONFIGURACIÓN DE IDIOMA ---
 LANGUAGE = 'es'  # Default language/Idioma predeterminado
@@ -65,12 +94,37 @@ TEXTS = {
     }
 }
 
-def get_text(key):
-    """Get the text based on the current language and key
-    /Obtener el texto según el idioma actual y la clave
+def set_grid_size(rows, cols):
+    """Change the board size before creating a game (up to 100x100 and beyond)
+    /Cambiar el tamaño del tablero antes de crear un juego (hasta 100x100 y más)
+    """
+    global GRID_ROWS, GRID_COLS, TOTAL_PAIRS
+    GRID_ROWS = rows
+    GRID_COLS = cols
+    TOTAL_PAIRS = (rows * cols) // 2
+
+def set_screen_size(width, height): # The window was resized/La ventana cambió de tamaño
+    global SCREEN_WIDTH, SCREEN_HEIGHT
+    SCREEN_WIDTH = width
+    SCREEN_HEIGHT = height
+
+def ui_scale(width=None, height=None):
+    """Scale of the UI for a window (the current one by default) relative to the design size,
+    in quarter steps so texts are only re-rendered when a step is crossed
+    /Escala de la interfaz para una ventana (la actual por defecto) respecto al tamaño de diseño,
+    en pasos de un cuarto para que los textos solo se vuelvan a renderizar al cruzar un paso
+    """
+    width = SCREEN_WIDTH if width is None else width
+    height = SCREEN_HEIGHT if height is None else height
+    scale = min(width / BASE_WIDTH, height / BASE_HEIGHT)
+    return max(0.5, int(scale * 4) / 4)
+
+def get_text(key, language=None):
+    """Get the text based on the current (or given) language and key
+    /Obtener el texto según el idioma actual (o el dado) y la clave
     """
         
-    return TEXTS[LANGUAGE].get(key, key)
+    return TEXTS[language or LANGUAGE].get(key, key)
 
 # -- 6. GAME DATA ---
 # Indexes for card pairs/Índices para pares de cartas
@@ -84,8 +138,8 @@ _COMPONENTS = {
         "LED", "Batería", "Interruptor", "Fusible", "Tierra"
     ]
 }
-def get_component_name(index):
-    """Get the component name based on the current language and index
-    /Obtener el nombre del componente según el idioma actual e índice  
+def get_component_name(index, language=None):
+    """Get the component name based on the current (or given) language and index
+    /Obtener el nombre del componente según el idioma actual (o el dado) e índice  
     """
-    return _COMPONENTS[LANGUAGE][index]
\ No newline at end of file
+    return _COMPONENTS[language or LANGUAGE][index]
\ No newline at end of file
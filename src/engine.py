@@ -0,0 +1,112 @@
+# --- HEADLESS GAME ENGINE/MOTOR DE JUEGO SIN PANTALLA ---
+# Pure-Python rules of the memory game: board, matching, flip-back timer and win condition.
+# No pygame here, so it runs in services and tests without SDL.
+# /Reglas del memorama en Python puro: tablero, emparejamiento, temporizador y condición de victoria.
+# Sin pygame, así que funciona en servicios y pruebas sin SDL.
+import time
+import random
+from array import array
+from . import config
+
+# Card kinds/Tipos de carta
+SYMBOL = 0
+TEXT = 1
+KINDS = ('symbol', 'text') # Kind code -> name used by the renderer/Código de tipo -> nombre usado por el renderizador
+
+# State flags/Banderas de estado
+FLIPPED = 1 # Face up this turn/Boca arriba en este turno
+MATCHED = 2 # Part of a found pair/Parte de un par encontrado
+
+def monotonic_ms(): # Default clock in milliseconds/Reloj predeterminado en milisegundos
+    return int(time.monotonic() * 1000)
+
+
+class GameEngine:
+    """Board state stored as parallel arrays indexed by grid slot (row by row)
+    /Estado del tablero guardado en arreglos paralelos indexados por celda (fila por fila)
+    """
+    __slots__ = ('pair_ids', 'kinds', 'state', 'flipped', 'pairs_found', 'total_pairs',
+                 'block_input', 'last_mismatch_time', 'mismatch_delay', 'clock', 'rng', 'seed')
+
+    def __init__(self, total_pairs=None, face_pool=None, mismatch_delay=None, seed=None, clock=None):
+        """
+        total_pairs: pairs on the board (default config.TOTAL_PAIRS)/pares en el tablero
+        face_pool: distinct faces to cycle through (default config.FACE_POOL_SIZE)/caras distintas a reutilizar
+        mismatch_delay: ms before mismatched cards flip back (default config.MISMATCH_DELAY)/ms antes de voltear las cartas no coincidentes
+        seed: seed for the shuffle, None picks a random one (kept in self.seed so the board can be rebuilt)/semilla para mezclar, None elige una al azar (se guarda en self.seed para reconstruir el tablero)
+        clock: callable returning the current time in ms/función que devuelve el tiempo actual en ms
+        """
+        self.total_pairs = config.TOTAL_PAIRS if total_pairs is None else total_pairs
+        face_pool = config.FACE_POOL_SIZE if face_pool is None else face_pool
+        self.mismatch_delay = config.MISMATCH_DELAY if mismatch_delay is None else mismatch_delay
+        self.clock = clock or monotonic_ms
+        self.seed = random.getrandbits(32) if seed is None else seed # Every board is reproducible from its seed/Cada tablero es reproducible desde su semilla
+        self.rng = random.Random(self.seed) # Private RNG so boards are reproducible/RNG privado para que los tableros sean reproducibles
+
+        deck = [] # (face, kind) for every card before shuffling/(cara, tipo) de cada carta antes de mezclar
+        for i in range(self.total_pairs):
+            face = i % face_pool # Reuse the faces when there are more pairs than assets/Reutilizar las caras cuando hay más pares que recursos
+            deck.append((face, SYMBOL))
+            deck.append((face, TEXT))
+        self.rng.shuffle(deck)
+
+        self.pair_ids = array('H', [face for face, _ in deck]) # Which face each card shows/Qué cara muestra cada carta
+        self.kinds = bytearray(kind for _, kind in deck) # SYMBOL or TEXT
+        self.state = bytearray(len(deck)) # FLIPPED/MATCHED flags
+        self.flipped = [] # Slots flipped this turn/Celdas volteadas en este turno
+        self.pairs_found = 0 # Number of pairs found/Número de pares encontrados
+        self.block_input = False # Whether input is blocked during the mismatch delay/Si la entrada está bloqueada durante el retraso
+        self.last_mismatch_time = 0 # Time when the last mismatch occurred/Hora de la última no coincidencia
+
+    def __len__(self): # Number of cards/Número de cartas
+        return len(self.state)
+
+    def flip(self, slot):
+        """Flip the card in a slot, returning True if it turned face up
+        /Voltear la carta de una celda, devolviendo True si quedó boca arriba
+        """
+        if self.block_input or self.state[slot]: # Blocked, already flipped or matched/Bloqueado, ya volteada o emparejada
+            return False
+        self.state[slot] = FLIPPED
+        self.flipped.append(slot)
+        if len(self.flipped) == 2: # Two cards up: check for a match/Dos cartas arriba: verificar si coinciden
+            self.check_match()
+        return True
+
+    def check_match(self): # Check if the two flipped cards are a match/Verificar si las dos cartas volteadas son un par
+        a, b = self.flipped
+        if self.pair_ids[a] == self.pair_ids[b]: # Same face: it's a match/Misma cara: es un par
+            self.state[a] = self.state[b] = FLIPPED | MATCHED
+            self.pairs_found += 1
+            self.flipped.clear()
+        else:
+            self.block_input = True # Block input until the cards flip back/Bloquear la entrada hasta voltear las cartas
+            self.last_mismatch_time = self.clock()
+
+    def update(self, now=None):
+        """Flip mismatched cards back once the delay is over, returning their slots
+        /Voltear las cartas no coincidentes cuando termine el retraso, devolviendo sus celdas
+        """
+        if not self.block_input:
+            return ()
+        if now is None:
+            now = self.clock()
+        if now - self.last_mismatch_time <= self.mismatch_delay: # Still showing the mismatch/Aún se muestra la no coincidencia
+            return ()
+        slots = tuple(self.flipped)
+        for slot in slots:
+            self.state[slot] = 0 # Face down again/Boca abajo de nuevo
+        self.flipped.clear()
+        self.block_input = False
+        return slots
+
+    def deadline(self): # Time at which update() will flip cards back, or None/Momento en que update() volteará las cartas, o None
+        if not self.block_input:
+            return None
+        return self.last_mismatch_time + self.mismatch_delay + 1
+
+    def is_face_up(self, slot): # Flipped or matched/Volteada o emparejada
+        return self.state[slot] != 0
+
+    def is_won(self): # All pairs found/Todos los pares encontrados
+        return self.pairs_found == self.total_pairs
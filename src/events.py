@@ -0,0 +1,9 @@
+import pygame
+
+# --- GAME EVENTS/EVENTOS DEL JUEGO ---
+# Custom event types live apart from game.py, so the main loop can recognize them before the board
+# code is imported.
+# /Los tipos de evento propios viven fuera de game.py, así el bucle principal puede reconocerlos antes
+# de importar el código del tablero.
+
+FLIP_BACK_EVENT = pygame.USEREVENT + 1 # Timer event posted when mismatched cards must flip back/Evento de temporizador para voltear las cartas no coincidentes
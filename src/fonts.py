@@ -0,0 +1,30 @@
+import pygame
+from . import config
+
+# --- FONT REGISTRY/REGISTRO DE FUENTES ---
+# pygame.font.SysFont scans the system font list on every call, so each (family, size, bold)
+# is resolved once per process and shared / pygame.font.SysFont recorre la lista de fuentes
+# del sistema en cada llamada, así que cada (familia, tamaño, negrita) se resuelve una vez por proceso
+
+_fonts = {} # Resolved fonts keyed by (family, size, bold)/Fuentes resueltas por (familia, tamaño, negrita)
+
+def get_font(family, size, bold=False):
+    """Get a shared font, resolving it on first use
+    /Obtener una fuente compartida, resolviéndola en el primer uso
+    """
+    key = (family, size, bold)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.SysFont(family, size, bold=bold) # Only the first lookup scans the system/Solo la primera búsqueda recorre el sistema
+        _fonts[key] = font
+    return font
+
+def preload(specs=None):
+    """Resolve fonts ahead of time (defaults to config.FONT_PRELOAD)
+    /Resolver fuentes por adelantado (por defecto config.FONT_PRELOAD)
+    """
+    for family, size, bold in (config.FONT_PRELOAD if specs is None else specs):
+        get_font(family, size, bold)
+
+def clear(): # Forget every resolved font (needed if pygame.font is re-initialized)/Olvidar todas las fuentes (necesario si se reinicia pygame.font)
+    _fonts.clear()
@@ -1,171 +1,293 @@
 import pygame
-import os   
-import random
 from . import config
+from . import fonts
+from . import assets
+from .animation import flip_frames
+from .engine import GameEngine, FLIPPED, MATCHED, KINDS
+from .spatial import GridIndex
+from .texts import text_cache
+from .events import FLIP_BACK_EVENT
 
 # -- 1. CARD CLASS/ClASE CARTA ---
-class Card:
-    def __init__(self, x, y, width, height, pair_id, kind): 
+class Card: # Drawable view of one engine slot/Vista dibujable de una celda del motor
+    __slots__ = ('rect', 'pair_id', 'kind', 'engine', 'slot', 'surface', 'back')
+
+    def __init__(self, x, y, width, height, pair_id, kind, engine, slot, language=None): 
         """
         kind: 'symbol'(image) or 'text'(string)/símbolo (imagen) o texto (cadena)
         pair_id: 0-9 (index in COMPONENT_NAMES)/índice en COMPONENT_NAMES
+        engine, slot: the rules engine and this card's position in it/el motor de reglas y la posición de esta carta en él
+        language: language of a text face (default config.LANGUAGE)/idioma de una cara de texto (por defecto config.LANGUAGE)
         """
+        self.back = assets.face_cache.get_back(width, height) # Shared card back/Reverso compartido de la carta
         self.rect = pygame.Rect(x, y, width, height) # Position and size/Posición y tamaño
         self.pair_id = pair_id # Which pair it belongs to/ a qué par pertenece
         self.kind = kind  # 'symbol' or 'text' to determine what to display/para determinar qué mostrar
-        self.flipped = False # Whether the card is currently flipped/si la carta está volteada
-        self.matched = False # Whether the card has been matched/si la carta ha sido emparejada
-        self.surface = self._create_surface(width, height) # Pre-render the card face/Pre-renderizar la cara de la carta
+        self.engine = engine # Owner of the flipped/matched state/Dueño del estado volteada/emparejada
+        self.slot = slot # Index in the engine arrays/Índice en los arreglos del motor
+        self.surface = assets.face_cache.get(pair_id, kind, width, height, language) # Borrow the shared pre-rendered face/Tomar prestada la cara pre-renderizada compartida
+
+    @property
+    def flipped(self): # Whether the card is currently flipped/si la carta está volteada
+        return bool(self.engine.state[self.slot] & FLIPPED)
+
+    @property
+    def matched(self): # Whether the card has been matched/si la carta ha sido emparejada
+        return bool(self.engine.state[self.slot] & MATCHED)
+
+    @property
+    def image(self): # The surface currently shown: face if flipped or matched, back otherwise/La superficie mostrada: cara si está volteada o emparejada, reverso si no
+        return self.surface if self.engine.state[self.slot] else self.back
 
-    def _create_surface(self, width, height):
-        """
-        Create the card surface based on its kind./Crear la superficie de la carta según su tipo.
-        """
-        surf = pygame.Surface((width, height)) # Start with a blank surface/Comenzar con una superficie en blanco
-        surf.fill(config.WHITE) # Card background color/Color de fondo de la carta
-        pygame.draw.rect(surf, config.BLACK, (0, 0, width, height), 3) # Card border/Dibujo del borde de la carta
-
-        # A) Text card / Carta de texto
-        if self.kind == 'text': 
-            name = config.get_component_name(self.pair_id)# Get the name based on current language/Obtener el nombre según el idioma actual
-            font_size = 18 if len(name) <= 8 else 15 # Dynamic font size based on text length/Tamaño de fuente dinámico según la longitud del texto
-            font = pygame.font.SysFont('Arial', font_size, bold=True) # Use a bold font for better readability/Usar una fuente en negrita para mejor legibilidad
-            text_surf = font.render(name, True, config.BLACK) # Render the text/Renderizar el texto
-            text_rect = text_surf.get_rect(center=(width//2, height//2)) # Center the text/Centrar el texto
-            surf.blit(text_surf, text_rect)# Draw the text onto the card/Dibujar el texto en la carta
-
-        # B) Symbol card / Carta de símbolo
-        elif self.kind == 'symbol':
-            filename = f"symbol_{self.pair_id}.png"# Image file name based on pair_id/Nombre del archivo de imagen basado en pair_id
-            relative_path = os.path.join(config.ASSETS_DIR, filename) # Relative path to the image/Ruta relativa a la imagen
-            full_path = config.get_path(relative_path) # Get the full path to the image/Obtener la ruta completa a la imagen
-
-            if os.path.exists(full_path): # Check if the image file exists/Verificar si el archivo de imagen existe
-                img = pygame.image.load(full_path).convert_alpha() # Load the image with transparency/Cargar la imagen con transparencia
-                # Smoothscale looks better for resizing/Smoothscale se ve mejor para redimensionar
-                img = pygame.transform.smoothscale(img, (width - 20, height - 20))
-                img_rect = img.get_rect(center=(width//2, height//2)) # Center the image/Centrar la imagen
-                surf.blit(img, img_rect) # Draw the image onto the card/Dibujar la imagen en la carta
-            else:
-                # Fallback if image is missing/Alternativa si falta la imagen
-                font = pygame.font.SysFont('Arial', 20, bold=True)
-                text_surf = font.render("Image Missing", True, config.RED)
-                text_rect = text_surf.get_rect(center=(width//2, height//2))
-                surf.blit(text_surf, text_rect) 
-
-        return surf # Return the pre-rendered card surface/Devolver la superficie de la carta pre-renderizada
-       
     def draw(self, screen): # Draw the card on the screen/Dibujar la carta en la pantalla
-        if self.flipped or self.matched: # If the card is flipped or matched, show its face/Si la carta está volteada o emparejada, mostrar su cara
-            screen.blit(self.surface, self.rect)
-        else:
-            # Draw the back of the card/Dibujar el reverso de la carta
-            pygame.draw.rect(screen, config.INDIGO, self.rect) # Card back color/Color del reverso de la carta
-            pygame.draw.rect(screen, config.BLACK, self.rect, 2) # Card back border/Borde del reverso de la carta
-        
-       
+        screen.blit(self.image, self.rect)
+
+
+# -- 2. LAYOUT/DISPOSICIÓN ---
+def score_font(): # (family, size, bold) of the score, sized with the window/(familia, tamaño, negrita) de la puntuación, según la ventana
+    return (config.FONT_FAMILY, max(1, round(24 * config.ui_scale())), True)
+
+def grid_layout(width, height, rows, cols):
+    """Compute where the cards go on a screen of the given size
+    /Calcular dónde van las cartas en una pantalla del tamaño dado
+    """
+    # 1. Calculate Card Size/Calcular el tamaño de la carta
+    top_margin = round(60 * config.ui_scale(width, height)) # Room for the score, scaled with the window/Espacio para la puntuación, escalado con la ventana
+    # Large boards shrink the gap so the cards still fit/Los tableros grandes reducen el espacio para que las cartas quepan
+    gap = min(config.CARD_GAP,
+              max(1, width // (cols * 8)),
+              max(1, (height - top_margin) // (rows * 8)))
+    
+    # Calculate available width/Calcular el ancho disponible
+    total_h_gap = (cols + 1) * gap # Total horizontal gap including margins/Gap horizontal total incluyendo márgenes
+    available_width = width - total_h_gap # Width left for cards/Ancho restante para las cartas
+    card_width = available_width // cols # Width of each card/Ancho de cada carta
+
+    # Calculate available height/Calcular el alto disponible
+    total_v_gap = (rows + 1) * gap # Total vertical gap including margins/Gap vertical total incluyendo márgenes
+    available_height = (height - top_margin) - total_v_gap # Height left for cards/Alto restante para las cartas
+    card_height = available_height // rows # Height of each card/Alto de cada carta
+
+    # 2. Center the grid/Centrar la cuadrícula
+    grid_pixel_w = cols * card_width + (cols - 1) * gap # Total width of the grid in pixels/Ancho total de la cuadrícula en píxeles
+    grid_pixel_h = rows * card_height + (rows - 1) * gap # Total height of the grid in pixels/Alto total de la cuadrícula en píxeles
+    
+    start_x = (width - grid_pixel_w) // 2 # Center the grid horizontally/Centrar la cuadrícula horizontalmente
+    start_y = top_margin + ((height - top_margin - grid_pixel_h) // 2) # Center the grid vertically within the available space/Centrar la cuadrícula verticalmente dentro del espacio disponible
+
+
+    return GridIndex(start_x, start_y, card_width, card_height, gap, rows, cols)
+
 
-# -- 2. GAME CLASS/CLASE JUEGO ---
-class MemoryGame:
-    def __init__(self): # Initialize game state/Inicializar el estado del juego
+# -- 3. GAME CLASS/CLASE JUEGO ---
+class MemoryGame: # Renderer and input adapter over a GameEngine/Renderizador y adaptador de entrada sobre un GameEngine
+    def __init__(self, engine=None, seed=None, layout=None, language=None): # Initialize game state/Inicializar el estado del juego
+        """
+        engine: rules engine to render (a new one is created if None)/motor de reglas a renderizar (se crea uno si es None)
+        seed: shuffle seed for the new engine/semilla de mezcla para el nuevo motor
+        layout, language: GridIndex and text language to build with (default: the current window and config.LANGUAGE);
+                          given by the prefetch thread so it never reads settings the main thread may be changing
+                          /GridIndex e idioma con los que construir (por defecto: la ventana actual y config.LANGUAGE);
+                          los da el hilo de precarga para no leer ajustes que el hilo principal puede estar cambiando
+        """
+        self.engine = engine if engine is not None else GameEngine(seed=seed, clock=pygame.time.get_ticks) # An engine with no cards is falsy (__len__)/Un motor sin cartas es falso (__len__)
         self.cards = [] # List to hold all the cards/Lista para contener todas las cartas
-        self.flipped = [] # Currently flipped cards/Cartas actualmente volteadas
-        self.pairs_found = 0 # Number of pairs found/Número de pares encontrados
-        self.block_input = False # Whether to block input during mismatch delay/Si bloquear la entrada durante el retraso de no coincidencia
-        self.last_mismatch_time = 0 # Time when the last mismatch occurred/Hora en que ocurrió la última no coincidencia
+        self.slots = [] # Card in each grid cell, row by row (None if empty)/Carta en cada celda, fila por fila (None si está vacía)
+        self.index = None # Maps a click position to its grid cell/Convierte una posición de clic en su celda
+        self.dirty_cards = [] # Cards changed since the last draw/Cartas que cambiaron desde el último dibujo
+        self.animations = {} # Card -> (start tick, old image, new image) while it turns over/Carta -> (tick inicial, imagen anterior, nueva) mientras se voltea
+        self.language = language or config.LANGUAGE # Language of the text faces/Idioma de las caras de texto
 
-        self.score_font = pygame.font.SysFont('Arial', 24, bold=True) # Font for score display/Fuente para la visualización de la puntuación
+        self.label_surf = None # 'Pairs Found' label, shared through text_cache/Etiqueta 'Pares Encontrados', compartida mediante text_cache
+        self.count_surf = None # Rendered "found/total" numbers/Números "encontrados/total" renderizados
+        self.score_rect = pygame.Rect(config.SCREEN_WIDTH//2, 10, 0, 0) # Where the score was last drawn/Dónde se dibujó la puntuación por última vez
+        self._score_key = None # (pairs_found, language) of the drawn score/(pares, idioma) de la puntuación dibujada
+        self._count_key = None # (pairs_found, font) of count_surf/(pares, fuente) de count_surf
         
-        self.generate_grid() # Generate the grid of cards/Generar la cuadrícula de cartas
+        self.generate_grid(layout) # Generate the grid of cards/Generar la cuadrícula de cartas
+
+    # The rules state lives in the engine/El estado de las reglas vive en el motor
+    @property
+    def pairs_found(self): # Number of pairs found/Número de pares encontrados
+        return self.engine.pairs_found
+
+    @pairs_found.setter
+    def pairs_found(self, value): # Used by the instant win cheat/Usado por el truco de victoria instantánea
+        self.engine.pairs_found = value
+
+    @property
+    def block_input(self): # Whether input is blocked during the mismatch delay/Si la entrada está bloqueada durante el retraso
+        return self.engine.block_input
+
+    @property
+    def last_mismatch_time(self): # Time when the last mismatch occurred/Hora en que ocurrió la última no coincidencia
+        return self.engine.last_mismatch_time
+
+    @property
+    def flipped(self): # Currently flipped cards/Cartas actualmente volteadas
+        return [self.cards[slot] for slot in self.engine.flipped]
+
+    @property
+    def animating(self): # Whether frames must keep coming/Si deben seguir llegando cuadros
+        return bool(self.animations)
     
-    def generate_grid(self):
+    def generate_grid(self, layout=None):
         """
-        Generate the grid of cards/Generar la cuadrícula de cartas
+        Lay out the engine's cards on the screen/Acomodar las cartas del motor en la pantalla
         """
-        # 1. Calculate Card Size/Calcular el tamaño de la carta
-        top_margin = 60 
-        
-        # Calculate available width/Calcular el ancho disponible
-        total_h_gap = (config.GRID_COLS + 1) * config.CARD_GAP # Total horizontal gap including margins/Gap horizontal total incluyendo márgenes
-        available_width = config.SCREEN_WIDTH - total_h_gap # Width left for cards/Ancho restante para las cartas
-        card_width = available_width // config.GRID_COLS # Width of each card/Ancho de cada carta
-
-        # Calculate available height/Calcular el alto disponible
-        total_v_gap = (config.GRID_ROWS + 1) * config.CARD_GAP # Total vertical gap including margins/Gap vertical total incluyendo márgenes
-        available_height = (config.SCREEN_HEIGHT - top_margin) - total_v_gap # Height left for cards/Alto restante para las cartas
-        card_height = available_height // config.GRID_ROWS # Height of each card/Alto de cada carta
-
-        # 2. Create the Card Pairs/Crear los pares de cartas
-        temp_cards = [] # Temporary list to hold cards before shuffling/Lista temporal para contener las cartas antes de mezclar
-        for i in range(10): 
-            card_a = Card(0, 0, card_width, card_height, i, 'symbol') # Symbol card for this pair/Carta de símbolo para este par
-            card_b = Card(0, 0, card_width, card_height, i, 'text')  # Text card for this pair/Carta de texto para este par
-            temp_cards.append(card_a) # Add symbol card to temp list/Agregar carta de símbolo a la lista temporal
-            temp_cards.append(card_b) # Add text card to temp list/Agregar carta de texto a la lista temporal
-        
-        random.shuffle(temp_cards) # Shuffle the cards to randomize their positions/Mezclar las cartas para aleatorizar sus posiciones
+        if layout is None: # Card size and grid origin/Tamaño de carta y origen de la cuadrícula
+            layout = grid_layout(config.SCREEN_WIDTH, config.SCREEN_HEIGHT, config.GRID_ROWS, config.GRID_COLS)
+        card_width, card_height, gap = layout.cell_width, layout.cell_height, layout.gap
 
-        # 3. Position Cards on the Grid
-        grid_pixel_w = config.GRID_COLS * card_width + (config.GRID_COLS - 1) * config.CARD_GAP # Total width of the grid in pixels/Ancho total de la cuadrícula en píxeles
-        grid_pixel_h = config.GRID_ROWS * card_height + (config.GRID_ROWS - 1) * config.CARD_GAP # Total height of the grid in pixels/Alto total de la cuadrícula en píxeles
-        
-        start_x = (config.SCREEN_WIDTH - grid_pixel_w) // 2 # Center the grid horizontally/Centrar la cuadrícula horizontalmente
-        start_y = top_margin + ((config.SCREEN_HEIGHT - top_margin - grid_pixel_h) // 2) # Center the grid vertically within the available space/Centrar la cuadrícula verticalmente dentro del espacio disponible
+        engine = self.engine
+        for slot in range(len(engine)): # One card per engine slot/Una carta por celda del motor
+            row = slot // layout.cols # Calculate row based on index/Calcular la fila según el índice
+            col = slot % layout.cols # Calculate column based on index/Calcular la columna según el índice
+            x = layout.x + col * (card_width + gap) # X position of the card/Posición x de la carta
+            y = layout.y + row * (card_height + gap) # Y position of the card/Posición y de la carta
+            self.cards.append(Card(x, y, card_width, card_height, engine.pair_ids[slot], KINDS[engine.kinds[slot]], engine, slot, self.language))
 
-        for index, card in enumerate(temp_cards): # Position each card based on its index/Posicionar cada carta según su índice
-            row = index // config.GRID_COLS # Calculate row based on index/Calcular la fila según el índice
-            col = index % config.GRID_COLS # Calculate column based on index/Calcular la columna según el índice
-            
-            card.rect.x = start_x + col * (card_width + config.CARD_GAP) # Set the x position of the card/Establecer la posición x de la carta
-            card.rect.y = start_y + row * (card_height + config.CARD_GAP) # Set the y position of the card/Establecer la posición y de la carta
-            self.cards.append(card) # Add the card to the game's card list/Agregar la carta a la lista de cartas del juego
+        self.slots = self.cards + [None] * (layout.rows * layout.cols - len(self.cards)) # Cells without a card stay empty/Las celdas sin carta quedan vacías
+        self.index = layout # Maps clicks back to slots/Convierte los clics en celdas
+
+    def relayout(self):
+        """Move and rescale the cards for the current window size, keeping the rules state.
+        Returns whether anything moved.
+        /Mover y reescalar las cartas para el tamaño actual de la ventana, conservando el estado de las reglas.
+        Devuelve si algo se movió.
+        """
+        layout = grid_layout(config.SCREEN_WIDTH, config.SCREEN_HEIGHT, config.GRID_ROWS, config.GRID_COLS)
+        old = self.index
+        if (layout.x, layout.y, layout.cell_width, layout.cell_height, layout.gap) == (old.x, old.y, old.cell_width, old.cell_height, old.gap):
+            return False
+        card_width, card_height, gap = layout.cell_width, layout.cell_height, layout.gap
+        back = assets.face_cache.get_back(card_width, card_height)
+        for card in self.cards:
+            row, col = divmod(card.slot, config.GRID_COLS)
+            card.rect = pygame.Rect(layout.x + col * (card_width + gap), layout.y + row * (card_height + gap), card_width, card_height)
+            card.back = back
+            card.surface = assets.face_cache.get(card.pair_id, card.kind, card_width, card_height, self.language) # Cached per size: dragging back is free/En caché por tamaño: volver a un tamaño es gratis
+        self.index = layout
+        self.animations.clear() # Their frames are for the old size/Sus cuadros son del tamaño anterior
+        self._score_key = None # Re-render the score at the new size and place/Volver a renderizar la puntuación con el nuevo tamaño y lugar
+        self.dirty_cards[:] = self.cards # Caller repaints the whole screen/Quien llama repinta toda la pantalla
+        return True
+
+    def update_language(self):
+        """Swap the text faces to the current language, mid-game, without touching the rules state
+        /Cambiar las caras de texto al idioma actual, a mitad del juego, sin tocar el estado de las reglas
+        """
+        if self.language == config.LANGUAGE:
+            return
+        self.language = config.LANGUAGE
+        for card in self.cards:
+            if card.kind == 'text': # A cache lookup per card, the faces already exist/Una búsqueda por carta, las caras ya existen
+                card.surface = assets.face_cache.get(card.pair_id, card.kind, card.rect.width, card.rect.height)
+        self.dirty_cards[:] = self.cards # Caller repaints the board/Quien llama repinta el tablero
+
+    def card_at(self, pos): # Get the card under a position in constant time, or None/Obtener la carta bajo una posición en tiempo constante, o None
+        slot = self.index.index_at(pos)
+        return None if slot is None else self.slots[slot]
 
     def handle_click(self, pos):
         """Handle card flipping logic
         /Manejar la lógica de volteo de cartas
         """
-        if self.block_input: # If we're currently blocking input due to a mismatch, ignore clicks/Si actualmente estamos bloqueando la entrada debido a una no coincidencia, ignorar los clics
+        card = self.card_at(pos) # Find the clicked card without scanning the board/Encontrar la carta clickeada sin recorrer el tablero
+        if card is None or not self.engine.flip(card.slot): # Empty cell, blocked, flipped or matched/Celda vacía, bloqueada, volteada o emparejada
             return
-        
-        for card in self.cards: # Check if the click is on a card and if it's not already flipped or matched/Verificar si el clic está en una carta y si no está ya volteada o emparejada
-        
-            if card.rect.collidepoint(pos) and not card.flipped and not card.matched: # If the card was clicked and is not already flipped or matched/Si se hizo clic en la carta y no está ya volteada o emparejada
-                card.flipped = True # Flip the card/Voltear la carta
-                self.flipped.append(card) # Add it to the list of currently flipped cards/Agregarlo a la lista de cartas actualmente volteadas
-                if len(self.flipped) == 2: # If two cards are flipped, check for a match/Si se voltearon dos cartas, verificar si coinciden
-                    self.check_match()
-                break # Only allow flipping one card per click/Solo permitir voltear una carta por clic
-        
-    def check_match(self): # Check if the two flipped cards are a match/Verificar si las dos cartas volteadas son un par
-        card1, card2 = self.flipped # Get the two flipped cards/Obtener las dos cartas volteadas
-        if card1.pair_id == card2.pair_id: # If the pair IDs match, it's a correct match/Si los IDs de par coinciden, es un par correcto
-            card1.matched = True # Mark the first card as matched/Marcar la primera carta como emparejada
-            card2.matched = True # Mark the second card as matched/Marcar la segunda carta como emparejada
-            self.pairs_found += 1 # Increment the pairs found count/Incrementar el conteo de pares encontrados
-            self.flipped.clear() # Clear the flipped list for the next turn/Limpiar la lista de volteadas para el siguiente turno
-        else:
-            self.block_input = True # Block input until we flip the cards back/ Bloquear la entrada hasta que volvamos a voltear las cartas
-            self.last_mismatch_time = pygame.time.get_ticks() # Record the time of the mismatch/Registrar la hora de la no coincidencia
-        
-    def update(self):
-        if self.block_input: # If we're blocking input due to a mismatch, check if enough time has passed to flip the cards back/Si estamos bloqueando la entrada debido a una no coincidencia, verificar si ha pasado suficiente tiempo para volver a voltear las cartas
-            current_time = pygame.time.get_ticks()
-            if current_time - self.last_mismatch_time > 1000: 
-                # 1 second delay/Retraso de 1 segundo
-                for card in self.flipped: # Flip the cards back over/Volver a voltear las cartas
-                    card.flipped = False # Unflip the card/Desvoltear la carta
-                self.flipped.clear() # Clear the flipped list for the next turn/Limpiar la lista de volteadas para el siguiente turno
-                self.block_input = False # Unblock input/Desbloquear la entrada
+        self.dirty_cards.append(card) # Its face must be drawn/Su cara debe dibujarse
+        self._animate(card, card.back, card.surface)
+        if self.engine.block_input: # This flip was a mismatch/Este volteo fue una no coincidencia
+            pygame.time.set_timer(FLIP_BACK_EVENT, self.engine.mismatch_delay + 1, loops=1) # Wake the loop when the delay is over/Despertar el bucle cuando termine el retraso
+
+    def update(self): # Flip mismatched cards back once the delay is over, returning their slots/Voltear las cartas no coincidentes cuando termine el retraso, devolviendo sus celdas
+        slots = self.engine.update()
+        for slot in slots:
+            card = self.cards[slot]
+            self.dirty_cards.append(card) # Its back must be drawn/Su reverso debe dibujarse
+            self._animate(card, card.surface, card.back)
+        return slots
+
+    def _animate(self, card, old, new): # Start turning a card over on the game clock/Empezar a voltear una carta con el reloj del juego
+        if config.FLIP_ANIMATION:
+            self.animations[card] = (self.engine.clock(), old, new)
+
+    def _animation_images(self):
+        """Current image of every animating card; finished cards get their final image once
+        /Imagen actual de cada carta animada; las que terminan reciben su imagen final una vez
+        """
+        if not self.animations:
+            return {}
+        now = self.engine.clock()
+        images = {}
+        for card, (start, old, new) in list(self.animations.items()):
+            progress = (now - start) / config.FLIP_DURATION
+            if progress >= 1:
+                del self.animations[card]
+                images[card] = card.image
+            else: # A pre-scaled frame, never a scale per frame/Un cuadro pre-escalado, nunca un escalado por cuadro
+                images[card] = flip_frames.frame(old, new, max(0.0, progress))
+        return images
+
+    def on_timer(self):
+        """Handle FLIP_BACK_EVENT, re-arming the timer if it fired early
+        /Manejar FLIP_BACK_EVENT, rearmando el temporizador si se disparó antes
+        """
+        slots = self.update()
+        deadline = self.engine.deadline()
+        if deadline is not None: # Not enough time has passed yet/Aún no ha pasado suficiente tiempo
+            pygame.time.set_timer(FLIP_BACK_EVENT, max(1, deadline - self.engine.clock()), loops=1)
+        return slots
+
+    def _render_score(self):
+        """Rebuild the score only when the pairs or the language changed; the label comes from text_cache
+        /Rehacer la puntuación solo si cambiaron los pares o el idioma; la etiqueta viene de text_cache
+        """
+        key = (self.pairs_found, config.LANGUAGE)
+        if key == self._score_key: # Nothing changed/Nada cambió
+            return False
+        self._score_key = key
+
+        font = score_font() # Font for score display/Fuente para la puntuación
+        self.label_surf = text_cache.get('pairs', font, config.BLACK) # Label in the current language, rendered once/Etiqueta en el idioma actual, renderizada una vez
+        if self._count_key != (self.pairs_found, font): # Only the numbers are rendered here/Aquí solo se renderizan los números
+            self._count_key = (self.pairs_found, font)
+            count_str = f" {self.pairs_found}/{config.TOTAL_PAIRS}" # Pairs found out of the total/Pares encontrados del total
+            self.count_surf = fonts.get_font(*font).render(count_str, True, config.BLACK)
+
+        width = self.label_surf.get_width() + self.count_surf.get_width()
+        height = max(self.label_surf.get_height(), self.count_surf.get_height())
+        self.score_rect = pygame.Rect(0, 0, width, height)
+        self.score_rect.midtop = (config.SCREEN_WIDTH//2, round(10 * config.ui_scale())) # Position the score at the top center/Posicionar la puntuación en la parte superior central
+        return True
+
+    def _blit_score(self, screen): # Label, then the numbers right after it/Etiqueta y, justo después, los números
+        screen.blit(self.label_surf, self.score_rect.topleft)
+        screen.blit(self.count_surf, (self.score_rect.x + self.label_surf.get_width(), self.score_rect.y))
 
     def draw(self, screen): # Draw all the cards and the score on the screen/Dibujar todas las cartas y la puntuación en la pantalla
-        for card in self.cards: 
-            card.draw(screen)
+        images = self._animation_images()
+        screen.blits([(images.get(card) or card.image, card.rect) for card in self.cards], False) # One batched call for the whole board/Una sola llamada agrupada para todo el tablero
+        self.dirty_cards.clear() # Every card is up to date/Todas las cartas están actualizadas
 
-        total_pairs = config.TOTAL_PAIRS # Total pairs in the game/Total de pares en el juego
-        label_text = config.get_text('pairs') # Get the label text based on the current language/Obtener el texto de la etiqueta según el idioma actual
-        score_str = f"{label_text} {self.pairs_found}/{total_pairs}" # Create the score string with the number of pairs found/Crear la cadena de puntuación con el número de pares encontrados
+        self._render_score()
+        self._blit_score(screen) # Draw the score on the screen/Dibujar la puntuación en la pantalla
 
-        score_surf = self.score_font.render(score_str, True, config.BLACK) # Render the score text/Renderizar el texto de la puntuación
-        
-        text_rect = score_surf.get_rect(midtop=(config.SCREEN_WIDTH//2, 10)) # Position the score at the top center/Posicionar la puntuación en la parte superior central
-        screen.blit(score_surf, text_rect) # Draw the score on the screen/Dibujar la puntuación en la pantalla
\ No newline at end of file
+    def draw_dirty(self, screen):
+        """Redraw only what changed since the last draw and return the changed rects
+        /Redibujar solo lo que cambió desde el último dibujo y devolver los rectángulos cambiados
+        """
+        images = self._animation_images()
+        changed = dict.fromkeys(self.dirty_cards) # Flipped or unflipped cards, once each/Cartas volteadas o desvolteadas, una vez cada una
+        changed.update(dict.fromkeys(images)) # Plus every card mid-animation/Más cada carta a mitad de animación
+        rects = [card.rect for card in changed]
+        screen.blits([(images.get(card) or card.image, card.rect) for card in changed], False)
+        self.dirty_cards.clear()
+
+        old_rect = self.score_rect # Area covered by the previous score text/Área cubierta por el texto anterior
+        if self._render_score():
+            screen.fill(config.GRAY, old_rect) # Erase the old text/Borrar el texto anterior
+            self._blit_score(screen)
+            rects.append(old_rect.union(self.score_rect))
+        return rects
@@ -0,0 +1,44 @@
+from collections import OrderedDict
+
+# --- SURFACE LRU/LRU DE SUPERFICIES ---
+# Least-recently-used store of surfaces bounded by count and by pixel memory, so caching every
+# size a window is dragged through cannot grow without limit.
+# /Almacén de superficies menos usadas recientemente, limitado por cantidad y por memoria de píxeles,
+# así guardar cada tamaño por el que se arrastra una ventana no puede crecer sin límite.
+
+def surface_bytes(surf): # Pixel memory of a surface/Memoria de píxeles de una superficie
+    return surf.get_pitch() * surf.get_height()
+
+
+class SurfaceLRU:
+    def __init__(self, max_items=None, max_bytes=None):
+        self.max_items = max_items # None for no count limit/None para no limitar la cantidad
+        self.max_bytes = max_bytes # None for no memory limit/None para no limitar la memoria
+        self.bytes = 0 # Pixel memory currently held/Memoria de píxeles ocupada
+        self._items = OrderedDict() # key -> (surface, bytes), oldest first/clave -> (superficie, bytes), la más antigua primero
+
+    def get(self, key): # The surface for key, marked as recently used, or None/La superficie de la clave, marcada como reciente, o None
+        entry = self._items.get(key)
+        if entry is None:
+            return None
+        self._items.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, surf):
+        size = surface_bytes(surf)
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.bytes -= old[1]
+        self._items[key] = (surf, size)
+        self.bytes += size
+        while len(self._items) > 1 and ((self.max_items is not None and len(self._items) > self.max_items) or
+                                        (self.max_bytes is not None and self.bytes > self.max_bytes)):
+            _, (_, evicted) = self._items.popitem(last=False) # Oldest first, never the one just added/La más antigua primero, nunca la recién agregada
+            self.bytes -= evicted
+
+    def clear(self):
+        self._items.clear()
+        self.bytes = 0
+
+    def __len__(self):
+        return len(self._items)
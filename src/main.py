@@ -1,57 +1,233 @@
 import pygame
 import sys
 from . import config
-from .game import MemoryGame
+from . import fonts
+from .events import FLIP_BACK_EVENT
 from .ui import MainMenu, WinScreen
+from .texts import text_cache
+from . import session
+from .profiler import FrameProfiler
 
 # Global State / Estado global
 current_state = "MENU" 
 game = None
 
+def open_window(window, size=None):
+    """Create the display surface, fullscreen at the desktop size or a (resizable) window
+    /Crear la superficie de pantalla, completa al tamaño del escritorio o una ventana (redimensionable)
+    """
+    if window['fullscreen']:
+        return pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+    return pygame.display.set_mode(size or window['size'], pygame.RESIZABLE if config.RESIZABLE else 0)
+
 # Main function to run the game/Función principal para ejecutar el juego
 def main():
-    pygame.init() # Initialize Pygame/Inicializar Pygame
-    screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT)) # Create the game window/Crear la ventana del juego
+    pygame.display.init() # Only the modules the game uses (no audio or joysticks to probe at boot)/Solo los módulos que usa el juego (sin audio ni joysticks que sondear al arrancar)
+    pygame.font.init()
+    window = {'fullscreen': config.FULLSCREEN, 'size': (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)} # Fullscreen flag and the windowed size to return to/Bandera de pantalla completa y el tamaño en ventana al que volver
+    screen = open_window(window) # Create the game window/Crear la ventana del juego
+    config.set_screen_size(*screen.get_size()) # Fullscreen picks the desktop size/La pantalla completa toma el tamaño del escritorio
     pygame.display.set_caption(config.get_text('title')) # Set the window title based on the current language/Establecer el título de la ventana según el idioma actual
     clock = pygame.time.Clock() # Create a clock to manage the frame rate/Crear un reloj para gestionar la tasa de fotogramas
 
+    prefetcher = None # Builds the next board in the background, created after the first frame/Construye el siguiente tablero en segundo plano, creado tras el primer cuadro
+    profiler = FrameProfiler.from_env() # None unless profiling is enabled/None a menos que se active el perfilado
+    recorder = session.Recorder.from_env(pygame.time.get_ticks) # None unless MEMORY_RECORD is set/None a menos que se defina MEMORY_RECORD
+    if recorder: # Clicks are in window pixels, so the replay needs the window size/Los clics están en píxeles de la ventana, así que la reproducción necesita su tamaño
+        recorder.record(session.RESIZE, *screen.get_size())
+    if profiler: # Time the scene draws too/Medir también el dibujo de las escenas
+        from .game import MemoryGame
+        profiler.instrument(MemoryGame, 'draw')
+        profiler.instrument(MemoryGame, 'draw_dirty')
+        profiler.instrument(MainMenu, 'draw')
+        profiler.instrument(MainMenu, 'draw_dirty')
+        profiler.instrument(WinScreen, 'draw')
+        profiler.instrument(WinScreen, 'draw_dirty')
+
+    def shutdown(): # Release the worker and write the profile and the session log/Liberar el trabajador y escribir el perfil y el registro de sesión
+        if recorder:
+            recorder.close()
+        if prefetcher:
+            prefetcher.shutdown()
+        if profiler:
+            profiler.restore()
+            profiler.dump()
+
     # --- ACTION CALLBACKS / FUNCIONES DE RETROALIMENTACIÓN DE ACCIÓN ---
     def start_game(): # Start a new game/Comenzar un nuevo juego
         global current_state, game # Set the current state to "GAME" and create a new game instance/Establecer el estado actual a "JUEGO" y crear una nueva instancia del juego
-        game = MemoryGame() # Create a new game instance/Crear una nueva instancia del juego
+        from .game import MemoryGame # The board code and card assets load with the first game/El código del tablero y los recursos de las cartas se cargan con el primer juego
+        game = prefetcher.take() if prefetcher else MemoryGame() # Swap in the prepared game or create one/Usar el juego preparado o crear uno
+        game.relayout() # A board prepared before a resize follows the window/Un tablero preparado antes de redimensionar sigue a la ventana
+        game.update_language() # A board prepared before a language switch swaps its text faces/Un tablero preparado antes de cambiar el idioma cambia sus caras de texto
+        win_screen.unfreeze() # The old board snapshot is no longer needed/La captura del tablero anterior ya no hace falta
+        if recorder: # The seed rebuilds this exact board/La semilla reconstruye este mismo tablero
+            recorder.start(game.engine.seed)
         current_state = "GAME" # Switch to the game state/Cambiar al estado del juego
+        request_full_redraw() # A new board replaces the old one/Un tablero nuevo reemplaza al anterior
 
     def go_to_menu(): # Return to the main menu/Volver al menú principal
         global current_state # Set the current state back to "MENU"/Establecer el estado actual de nuevo a "MENU"
         current_state = "MENU" # Switch to the menu state/Cambiar al estado del menú
+        win_screen.unfreeze()
+        if recorder:
+            recorder.record(session.MENU)
 
     def exit_game(): # Exit the game/Salir del juego
+        shutdown()
         pygame.quit()
         sys.exit()
 
     def toggle_language(): # Toggle the language between English and Spanish/Alternar el idioma entre inglés y español
         # 1. Flip the language config/Cambiar la configuración del idioma
         config.LANGUAGE = 'es' if config.LANGUAGE == 'en' else 'en'
+        if recorder:
+            recorder.record(session.LANGUAGE)
         pygame.display.set_caption(config.get_text('title')) 
         
-        # 2. Tell the UI Managers to refresh their text / Decirles a los administradores de UI que actualicen su texto
+        # 2. Tell the UI Managers to refresh their text (cached surfaces, nothing is rendered) / Decirles a los administradores de UI que actualicen su texto (superficies en caché, no se renderiza nada)
         menu_screen.update_language()
         win_screen.update_language()
+        if game is not None: # Works mid-game: only the text faces are swapped/Funciona a mitad del juego: solo se cambian las caras de texto
+            game.update_language()
+            if current_state == "WIN": # The frozen board shows the old names/El tablero congelado muestra los nombres anteriores
+                enter_modal(win_screen, game)
+        request_full_redraw() # The titles changed size, repaint everything/Los títulos cambiaron de tamaño, repintar todo
+
+    def resize(size): # The window was resized by the user/El usuario redimensionó la ventana
+        nonlocal screen
+        if screen.get_size() != size: # Drivers that do not resize the surface themselves/Controladores que no redimensionan la superficie solos
+            screen = open_window(window, size)
+        apply_window_size()
+
+    def toggle_fullscreen(): # Switch between a window and the whole screen/Alternar entre ventana y pantalla completa
+        nonlocal screen
+        if not window['fullscreen']:
+            window['size'] = screen.get_size() # Come back to the same window size/Volver al mismo tamaño de ventana
+        window['fullscreen'] = not window['fullscreen']
+        screen = open_window(window)
+        apply_window_size()
+
+    def apply_window_size(): # Lay every scene out for the current window size/Acomodar cada escena al tamaño actual de la ventana
+        size = screen.get_size()
+        if size == (config.SCREEN_WIDTH, config.SCREEN_HEIGHT):
+            return
+        config.set_screen_size(*size)
+        if recorder:
+            recorder.record(session.RESIZE, *size)
+        menu_screen.layout()
+        win_screen.layout()
+        if game is not None: # The rules state is kept, only the cards move/El estado de las reglas se conserva, solo se mueven las cartas
+            game.relayout()
+            if current_state == "WIN": # The snapshot has the old size/La captura tiene el tamaño anterior
+                enter_modal(win_screen, game)
+        if prefetcher: # Its board and warmed faces are for the old size/Su tablero y caras precargadas son del tamaño anterior
+            prefetcher.invalidate()
+        idle['rewarm'] = True
+        request_full_redraw()
 
     # --- INITIALIZE SCENES / INICIALIZAR ESCENAS ---
     # We just create the managers and pass them the functions they need to call / Simplemente creamos los administradores y les pasamos las funciones que necesitan llamar
     menu_screen = MainMenu(start_game, toggle_language, exit_game)
     win_screen = WinScreen(start_game, go_to_menu, exit_game)
 
+    def warm_up(): # Everything the first frame does not need, once it is on screen/Todo lo que el primer cuadro no necesita, una vez que está en pantalla
+        nonlocal prefetcher
+        if config.PRELOAD_FONTS: # Resolve every font once/Resolver todas las fuentes una vez
+            fonts.preload()
+        if config.PRELOAD_TEXT: # Render the other languages' texts now instead of on the first switch/Renderizar los textos de los otros idiomas ahora y no en el primer cambio
+            text_cache.warm()
+        if config.PREFETCH_GAMES:
+            from .prefetch import GamePrefetcher # Imports the board code and assets/Importa el código del tablero y los recursos
+            prefetcher = GamePrefetcher()
+
+    def rewarm(): # What warm_up() rendered, again for the new window size/Lo que warm_up() renderizó, de nuevo para el nuevo tamaño de ventana
+        if config.PRELOAD_TEXT: # Texts at the new font sizes, other languages included/Textos con los nuevos tamaños de fuente, otros idiomas incluidos
+            text_cache.warm()
+        if game is not None: # Faces, score label and flip frames at the new card size/Caras, etiqueta y cuadros del volteo al nuevo tamaño de carta
+            from .prefetch import warm_layout
+            warm_layout(game.index)
+
+    idle = {'rewarm': False} # Whether the window changed size since the last rewarm()/Si la ventana cambió de tamaño desde el último rewarm()
+
+    # --- DRAWING / DIBUJO ---
+    redraw = {'full': True, 'state': None} # Whether the whole screen must be repainted and for which state/Si se debe repintar toda la pantalla y para qué estado
+
+    def request_full_redraw(): # Repaint the whole screen on the next frame/Repintar toda la pantalla en el siguiente cuadro
+        redraw['full'] = True
+
+    def enter_modal(scene, behind): # Freeze the scene behind a modal into its background/Congelar la escena detrás de un modal en su fondo
+        screen.fill(config.GRAY)
+        behind.draw(screen) # Not flipped, only captured/No se muestra, solo se captura
+        scene.freeze(screen)
+
+    def draw_full(): # Repaint every element of the current state/Repintar todos los elementos del estado actual
+        redraw['full'] = False # No frame is owed after this, in either render mode/Después de esto no se debe ningún cuadro, en ningún modo
+        redraw['state'] = current_state
+        screen.fill(config.GRAY) # Clear the screen with a gray background/Limpiar la pantalla con un fondo gris
+
+        if current_state == "MENU": # If we're in the menu, draw the menu/Si estamos en el menú, dibujar el menú
+            menu_screen.draw(screen)
+
+        elif current_state == "GAME": # If we're in the game, draw the game/Si estamos en el juego, dibujar el juego
+            game.draw(screen)
+
+        elif current_state == "WIN": # The win screen carries the shaded final board as its background/La pantalla de victoria lleva el tablero final sombreado como fondo
+            win_screen.draw(screen) # Draw the win screen/Dibujar la pantalla de victoria
+
+        if profiler and profiler.overlay: # Stats on top of everything/Estadísticas encima de todo
+            profiler.draw_overlay(screen)
+        pygame.display.flip() # Update the display/Actualizar la pantalla
+
+    def draw_dirty(): # Push only the areas that changed since the last frame/Actualizar solo las áreas que cambiaron desde el último cuadro
+        if redraw['full'] or redraw['state'] != current_state: # New scene or forced repaint/Nueva escena o repintado forzado
+            draw_full()
+            return
+
+        rects = []
+        if current_state == "MENU":
+            rects = menu_screen.draw_dirty(screen)
+        elif current_state == "GAME":
+            rects = game.draw_dirty(screen)
+        elif current_state == "WIN": # Only hovered buttons, over the frozen board/Solo los botones con hover, sobre el tablero congelado
+            rects = win_screen.draw_dirty(screen)
+        if profiler and profiler.overlay: # Opaque box, repainted every frame/Caja opaca, repintada en cada cuadro
+            rects.append(profiler.draw_overlay(screen))
+        if rects:
+            pygame.display.update(rects) # Update only the changed areas/Actualizar solo las áreas cambiadas
+
     # --- GAME LOOP / BUCLE DEL JUEGO ---
     global current_state # We need to modify the global state variable inside the loop/ Necesitamos modificar la variable de estado global dentro del bucle
     running = True # Main loop flag/Bandera del bucle principal
+    warmed = False # Whether warm_up() ran after the first frame/Si warm_up() se ejecutó tras el primer cuadro
     
     while running:
         # 1. Event Handling / Manejo de eventos
-        for event in pygame.event.get():
+        pending = redraw['full'] or redraw['state'] != current_state # A frame is owed (e.g. the very first one)/Se debe un cuadro (p. ej. el primero)
+        pending = pending or (current_state == "GAME" and game.animating) # Cards turning over need every frame/Las cartas volteándose necesitan cada cuadro
+        if config.EVENT_DRIVEN and not pending: # Sleep until something happens/Dormir hasta que algo ocurra
+            events = [pygame.event.wait()] + pygame.event.get()
+        else:
+            events = pygame.event.get()
+        if profiler: # The wait for events is idle time, not frame time/La espera de eventos es tiempo libre, no de cuadro
+            profiler.begin_frame()
+
+        resized = None # Only the last size of a drag is laid out/Solo se acomoda el último tamaño de un arrastre
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type == pygame.VIDEORESIZE:
+                resized = event.size
+                continue # Scenes never see it/Las escenas nunca lo ven
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F11: # Fullscreen on and off/Pantalla completa sí y no
+                toggle_fullscreen()
+            elif event.type == pygame.VIDEOEXPOSE: # The window contents were lost/Se perdió el contenido de la ventana
+                request_full_redraw()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_l: # Switch the language from any screen (kiosks have no menu access mid-game)/Cambiar el idioma desde cualquier pantalla
+                toggle_language()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3 and profiler: # Show or hide the profiler stats/Mostrar u ocultar las estadísticas
+                profiler.toggle_overlay()
+                request_full_redraw() # Uncover what was under the overlay/Descubrir lo que había bajo la superposición
             # -----------------------------------------------------------------------------------------------------------------------------------------------------------|
             # Insta win Cheat Code, uncomment to enable, for testing purposes. Press W during the game to instantly win.                                                 |
             # Código de truco de victoria instantánea, descomentar para habilitar, para propósitos de prueba. Presiona W durante el juego para ganar instantáneamente.   |
@@ -66,31 +242,52 @@ def main():
             
             elif current_state == "GAME": # If we're in the game, we need to handle card clicks as well as delegate to the game/Si estamos en el juego, necesitamos manejar los clics de las cartas además de delegar al juego
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                    if recorder:
+                        recorder.record(session.CLICK, *event.pos)
                     game.handle_click(event.pos)
+                elif event.type == FLIP_BACK_EVENT: # The mismatch delay is over/Terminó el retraso de no coincidencia
+                    if game.on_timer() and recorder:
+                        recorder.record(session.FLIP_BACK)
 
             elif current_state == "WIN": # If we're in the win screen, let it handle the events/Si estamos en la pantalla de victoria, dejar que maneje los eventos
                 win_screen.handle_event(event)
 
+        if resized is not None:
+            resize(resized)
+        if profiler:
+            profiler.lap('events')
+
         # 2. Update Logic/Lógica de actualización
         if current_state == "GAME":
-            game.update() # Update the game state/Actualizar el estado del juego
-            if game.pairs_found == 10: # Check for win condition/Verificar la condición de victoria
+            if game.update() and recorder: # Update the game state/Actualizar el estado del juego
+                recorder.record(session.FLIP_BACK)
+            if game.pairs_found == config.TOTAL_PAIRS and not game.animating: # Check for win condition, once the last card has turned/Verificar la condición de victoria, cuando la última carta terminó de voltearse
                 current_state = "WIN"
+                if recorder:
+                    recorder.record(session.WIN)
+                enter_modal(win_screen, game) # The board is final from here on/El tablero ya no cambia desde aquí
+        if profiler:
+            profiler.lap('update')
 
         # 3. Drawing/Dibujar
-        screen.fill(config.GRAY) # Clear the screen with a gray background/Limpiar la pantalla con un fondo gris
+        if config.DIRTY_RECTS:
+            draw_dirty()
+        else:
+            draw_full()
+        if profiler:
+            profiler.lap('draw')
+            profiler.end_frame()
 
-        if current_state == "MENU": # If we're in the menu, draw the menu/Si estamos en el menú, dibujar el menú
-            menu_screen.draw(screen)
-
-        elif current_state == "GAME": # If we're in the game, draw the game/Si estamos en el juego, dibujar el juego
-            game.draw(screen)
-
-        elif current_state == "WIN": # If we're in the win screen, draw the game behind the win screen for a nice effect, then draw the win screen/Si estamos en la pantalla de victoria, dibujar el juego detrás de la pantalla de victoria para un efecto agradable, luego dibujar la pantalla de victoria
-            game.draw(screen) # Draw game behind the win screen/Dibujar el juego detrás de la pantalla de victoria
-            win_screen.draw(screen) # Draw the win screen/Dibujar la pantalla de victoria
-
-        pygame.display.flip() # Update the display/Actualizar la pantalla
+        # 4. Idle work/Trabajo en reposo
+        if not warmed: # The menu is already showing/El menú ya se muestra
+            warm_up()
+            warmed = True
+        if idle['rewarm']: # So a language switch after a resize renders nothing/Así cambiar el idioma tras redimensionar no renderiza nada
+            rewarm()
+            idle['rewarm'] = False
+        if prefetcher and current_state != "GAME": # The frame is already on screen/El cuadro ya está en pantalla
+            prefetcher.prefetch()
         clock.tick(config.FPS) # Cap the frame rate to the configured FPS/ Limitar la tasa de fotogramas a los FPS configurados
 
+    shutdown()
     pygame.quit() # Quit Pygame/Salir de Pygame
\ No newline at end of file
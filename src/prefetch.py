@@ -0,0 +1,80 @@
+import pygame
+from concurrent.futures import ThreadPoolExecutor
+from . import config
+from . import fonts
+from . import assets
+from .engine import GameEngine, KINDS
+from .animation import flip_frames
+from .texts import text_cache
+from .game import MemoryGame, grid_layout, score_font
+
+# --- NEXT GAME PREFETCH/PRECARGA DEL SIGUIENTE JUEGO ---
+# While the win screen or the menu is showing, the next board is shuffled, laid out and wrapped in
+# a MemoryGame on a worker thread, so "Restart" only swaps it in.
+# /Mientras se muestra la pantalla de victoria o el menú, el siguiente tablero se mezcla, se acomoda
+# y se envuelve en un MemoryGame en un hilo trabajador, así que "Reiniciar" solo lo intercambia.
+
+def warm_layout(layout):
+    """Render on the main thread everything a board of this layout shows: the faces and the score label
+    in every language, and the flip frames
+    /Renderizar en el hilo principal todo lo que muestra un tablero de esta disposición: las caras y la
+    etiqueta de la puntuación en todos los idiomas, y los cuadros del volteo
+    """
+    width, height = layout.cell_width, layout.cell_height
+    assets.face_cache.warm(width, height, config.TOTAL_PAIRS, config.TEXTS) # Every language, so switching mid-game is a lookup/Todos los idiomas, así cambiar a mitad del juego es una búsqueda
+    fonts.preload() # The score font too/También la fuente de la puntuación
+    for language in config.TEXTS: # Score label in every language/Etiqueta de la puntuación en todos los idiomas
+        text_cache.get('pairs', score_font(), config.BLACK, language)
+    if config.FLIP_ANIMATION: # Squash frames for the back and each face/Cuadros aplastados del reverso y de cada cara
+        faces = [assets.face_cache.get(pair_id, kind, width, height)
+                 for pair_id in range(min(config.TOTAL_PAIRS, config.FACE_POOL_SIZE)) for kind in KINDS]
+        flip_frames.warm([assets.face_cache.get_back(width, height)] + faces)
+
+
+class GamePrefetcher:
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='prefetch') # One board at a time/Un tablero a la vez
+        self._future = None # Board being prepared or ready/Tablero en preparación o listo
+
+    def prefetch(self):
+        """Start preparing the next game if none is pending
+        /Empezar a preparar el siguiente juego si no hay ninguno pendiente
+        """
+        if self._future is not None:
+            return
+        # Rendering is not thread-safe, so the faces are rendered here on the main thread; this is
+        # all cache hits after the first game. The worker then only does pure-Python work and cache lookups.
+        # /Renderizar no es seguro entre hilos, así que las caras se renderizan aquí en el hilo principal;
+        # tras el primer juego todo son aciertos de caché. El trabajador solo hace Python puro y búsquedas.
+        # The worker gets this layout and language, so what it looks up is exactly what was warmed.
+        # /El trabajador recibe esta disposición e idioma, así lo que busca es exactamente lo precargado.
+        layout = grid_layout(config.SCREEN_WIDTH, config.SCREEN_HEIGHT, config.GRID_ROWS, config.GRID_COLS)
+        warm_layout(layout)
+        self._future = self._executor.submit(self._prepare, layout, config.LANGUAGE, config.TOTAL_PAIRS, config.FACE_POOL_SIZE)
+
+    @staticmethod
+    def _prepare(layout, language, total_pairs, face_pool): # Runs on the worker thread, reads no live settings/Se ejecuta en el hilo trabajador, no lee ajustes en vivo
+        engine = GameEngine(total_pairs=total_pairs, face_pool=face_pool, clock=pygame.time.get_ticks)
+        with assets.face_cache.lookup_only(): # A face evicted meanwhile fails the build instead of rendering here/Una cara desalojada mientras tanto hace fallar la construcción en vez de renderizar aquí
+            return MemoryGame(engine=engine, layout=layout, language=language) # Shuffle, layout and cards/Mezcla, disposición y cartas
+
+    def take(self):
+        """Get the prepared game (waiting if it is still being built) or build one now
+        /Obtener el juego preparado (esperando si aún se construye) o crear uno ahora
+        """
+        future, self._future = self._future, None
+        if future is not None:
+            try:
+                return future.result() # Usually already done/Normalmente ya terminó
+            except Exception: # E.g. LookupError from lookup_only(): fall back to a synchronous build/P. ej. LookupError de lookup_only(): volver a una construcción síncrona
+                pass
+        return MemoryGame()
+
+    def invalidate(self): # Drop the prepared game (e.g. the window was resized)/Descartar el juego preparado (p. ej. se redimensionó la ventana)
+        if self._future is not None:
+            self._future.cancel()
+            self._future = None
+
+    def shutdown(self):
+        self.invalidate()
+        self._executor.shutdown(wait=False)
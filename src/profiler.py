@@ -0,0 +1,178 @@
+import os
+import time
+import functools
+from array import array
+from . import config # No pygame at import time: src.server uses percentile() headless/Sin pygame al importar: src.server usa percentile() sin pantalla
+
+# --- FRAME PROFILER/PERFILADOR DE CUADROS ---
+# Opt-in with MEMORY_PROFILE=1 (or config.PROFILE). Times the event, update and draw phases of every
+# frame plus the main draw calls, keeps the last samples in ring buffers, shows an overlay (F3) and
+# writes <prefix>.csv and <prefix>.json on exit (prefix from MEMORY_PROFILE_OUT, default "profile").
+# /Se activa con MEMORY_PROFILE=1 (o config.PROFILE). Mide las fases de eventos, actualización y
+# dibujo de cada cuadro y las llamadas de dibujo principales, guarda las últimas muestras en búferes
+# circulares, muestra una superposición (F3) y escribe <prefijo>.csv y <prefijo>.json al salir.
+
+PHASES = ('events', 'update', 'draw')
+
+
+class RingBuffer: # Fixed-size float buffer that overwrites the oldest sample/Búfer de tamaño fijo que sobrescribe la muestra más antigua
+    __slots__ = ('data', 'index', 'count')
+
+    def __init__(self, capacity):
+        self.data = array('d', bytes(8 * capacity)) # Preallocated, no allocation per frame/Prealocado, sin asignaciones por cuadro
+        self.index = 0 # Next slot to write/Siguiente posición a escribir
+        self.count = 0 # Samples stored/Muestras guardadas
+
+    def push(self, value):
+        self.data[self.index] = value
+        self.index = (self.index + 1) % len(self.data)
+        if self.count < len(self.data):
+            self.count += 1
+
+    def values(self): # Samples from oldest to newest/Muestras de la más antigua a la más reciente
+        if self.count < len(self.data):
+            return self.data[:self.count].tolist()
+        return self.data[self.index:].tolist() + self.data[:self.index].tolist()
+
+
+def percentile(values, pct): # Nearest-rank percentile/Percentil por rango más cercano
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+class FrameProfiler:
+    def __init__(self, capacity=None, output=None):
+        capacity = capacity or config.PROFILE_SAMPLES
+        self.output = output or os.environ.get('MEMORY_PROFILE_OUT', 'profile') # File prefix for the dump/Prefijo de archivo para el volcado
+        self.budget_ms = 1000 / config.FPS if config.FPS else 0 # Frame budget/Presupuesto de cuadro
+        self.phases = {name: RingBuffer(capacity) for name in PHASES} # Per-phase ms/ms por fase
+        self.total = RingBuffer(capacity) # Whole frame ms (waiting for events excluded)/ms del cuadro completo (sin esperar eventos)
+        self.sections = {} # Instrumented calls: name -> RingBuffer of ms per frame/Llamadas instrumentadas: nombre -> ms por cuadro
+        self._section_ms = {} # Section time accumulated in the current frame/Tiempo acumulado en el cuadro actual
+        self._originals = [] # (cls, method, function) replaced by instrument()/(clase, método, función) reemplazados por instrument()
+        self.frames = 0 # Frames measured/Cuadros medidos
+        self.dropped = 0 # Frames over budget/Cuadros sobre el presupuesto
+        self.overlay = False # Whether the overlay is visible/Si la superposición es visible
+        self._frame_start = 0.0
+        self._lap_start = 0.0
+        self._overlay_surf = None # Cached overlay, refreshed a few times per second/Superposición en caché, se refresca unas veces por segundo
+        self._overlay_time = 0.0
+        import pygame
+        self.overlay_rect = pygame.Rect(0, 0, 260, 64) # Opaque box in the top-left corner/Caja opaca en la esquina superior izquierda
+
+    @classmethod
+    def from_env(cls): # A profiler if MEMORY_PROFILE or config.PROFILE is set, else None/Un perfilador si está activado, si no None
+        if config.PROFILE or os.environ.get('MEMORY_PROFILE', '') not in ('', '0'):
+            return cls()
+        return None
+
+    # --- Timing/Medición ---
+    def begin_frame(self):
+        self._frame_start = self._lap_start = time.perf_counter()
+
+    def lap(self, phase): # Close a phase that started at the previous lap/Cerrar una fase que empezó en la vuelta anterior
+        now = time.perf_counter()
+        self.phases[phase].push((now - self._lap_start) * 1000)
+        self._lap_start = now
+
+    def end_frame(self):
+        total = (time.perf_counter() - self._frame_start) * 1000
+        self.total.push(total)
+        self.frames += 1
+        if self.budget_ms and total > self.budget_ms:
+            self.dropped += 1
+        for name, ring in self.sections.items(): # Sections not called this frame record 0/Las secciones no llamadas registran 0
+            ring.push(self._section_ms.get(name, 0.0))
+        self._section_ms.clear()
+
+    def instrument(self, cls, method, name=None):
+        """Wrap cls.method so its time is recorded each frame (only done when profiling)
+        /Envolver cls.method para registrar su tiempo en cada cuadro (solo al perfilar)
+        """
+        name = name or f"{cls.__name__}.{method}"
+        original = getattr(cls, method) # May be inherited (e.g. WinScreen.draw from ModalScene)/Puede ser heredado (p. ej. WinScreen.draw de ModalScene)
+        self._originals.append((cls, method, cls.__dict__.get(method)))
+        self.sections.setdefault(name, RingBuffer(len(self.total.data)))
+        section_ms = self._section_ms
+
+        @functools.wraps(original)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                section_ms[name] = section_ms.get(name, 0.0) + (time.perf_counter() - start) * 1000
+        setattr(cls, method, timed)
+
+    def restore(self): # Undo instrument()/Deshacer instrument()
+        while self._originals:
+            cls, method, original = self._originals.pop()
+            if original is None: # It was inherited: uncover the base class method again/Era heredado: volver a mostrar el método de la clase base
+                delattr(cls, method)
+            else:
+                setattr(cls, method, original)
+
+    # --- Overlay/Superposición ---
+    def toggle_overlay(self):
+        self.overlay = not self.overlay
+        self._overlay_surf = None
+
+    def draw_overlay(self, screen):
+        """Draw the stats box and return its rect
+        /Dibujar la caja de estadísticas y devolver su rectángulo
+        """
+        import pygame
+        from . import fonts
+        now = time.perf_counter()
+        if self._overlay_surf is None or now - self._overlay_time > 0.25: # Re-render at 4 Hz/Volver a renderizar a 4 Hz
+            self._overlay_time = now
+            totals = self.total.values()
+            last = totals[-1] if totals else 0.0
+            font = fonts.get_font(config.FONT_FAMILY, 16, bold=False)
+            lines = [
+                f"frame {last:.2f} ms  p50 {percentile(totals, 50):.2f}  p99 {percentile(totals, 99):.2f}",
+                " ".join(f"{p} {percentile(self.phases[p].values(), 50):.2f}" for p in PHASES),
+                f"dropped {self.dropped}/{self.frames} (budget {self.budget_ms:.1f} ms)",
+            ]
+            surf = pygame.Surface(self.overlay_rect.size)
+            surf.fill(config.BLACK)
+            for i, line in enumerate(lines):
+                surf.blit(font.render(line, True, config.GREEN), (6, 4 + i * 19))
+            self._overlay_surf = surf
+        screen.blit(self._overlay_surf, self.overlay_rect)
+        return self.overlay_rect
+
+    # --- Export/Exportación ---
+    def summary(self): # Percentiles per phase and section/Percentiles por fase y sección
+        def describe(values):
+            return {
+                'mean_ms': sum(values) / len(values) if values else 0.0,
+                'p50_ms': percentile(values, 50),
+                'p99_ms': percentile(values, 99),
+                'max_ms': max(values) if values else 0.0,
+            }
+        return {
+            'frames': self.frames,
+            'dropped': self.dropped,
+            'budget_ms': self.budget_ms,
+            'frame': describe(self.total.values()),
+            'phases': {name: describe(ring.values()) for name, ring in self.phases.items()},
+            'sections': {name: describe(ring.values()) for name, ring in self.sections.items()},
+        }
+
+    def dump(self):
+        """Write the buffered samples to <prefix>.csv and the summary to <prefix>.json
+        /Escribir las muestras a <prefijo>.csv y el resumen a <prefijo>.json
+        """
+        import csv, json # Only needed on exit/Solo se necesitan al salir
+        columns = {'frame_ms': self.total.values()}
+        columns.update({f"{name}_ms": ring.values() for name, ring in self.phases.items()})
+        columns.update({f"{name}_ms": ring.values() for name, ring in self.sections.items()})
+        with open(self.output + '.csv', 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(columns.keys())
+            writer.writerows(zip(*columns.values()))
+        with open(self.output + '.json', 'w') as f:
+            json.dump(self.summary(), f, indent=2)
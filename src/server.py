@@ -0,0 +1,283 @@
+# --- MULTI-SESSION GAME SERVER/SERVIDOR DE JUEGO MULTISESIÓN ---
+# Many independent boards on one asyncio loop, one GameEngine per connection. Clients speak JSON
+# lines over TCP or a Unix socket; mismatched cards flip back from a loop.call_later callback, so
+# an idle board costs no CPU.
+# /Muchos tableros independientes en un bucle asyncio, un GameEngine por conexión. Los clientes
+# hablan líneas JSON por TCP o un socket Unix; las cartas no coincidentes se voltean desde un
+# callback de loop.call_later, así un tablero inactivo no consume CPU.
+#
+# Serve/Servir:      python -m src.server serve [--host 127.0.0.1 --port 8765 | --unix /tmp/memory.sock]
+# Load/Carga:        python -m src.server loadgen --sessions 10000 [--port 8765 | --unix /tmp/memory.sock]
+#
+# Protocol/Protocolo (one JSON object per line/un objeto JSON por línea):
+#   {"op": "flip", "slot": 3}                 -> {"ok": true, "flipped": true, "face": 4, "kind": "text", "match": null, ...}
+#   {"op": "state"}                           -> {"ok": true, "cards": 20, "face_up": [[slot, face, kind], ...], ...}
+#   {"op": "restart", "seed": 1, "pairs": 10} -> {"ok": true, "cards": 20, "seed": 1, ...}
+#   Pushed by the server/Enviado por el servidor: {"event": "flip_back", "slots": [3, 7]}
+import os
+import sys
+import json
+import time
+import random
+import signal
+import asyncio
+import argparse
+import statistics
+from . import config
+from .engine import GameEngine, KINDS
+from .profiler import percentile
+
+MAX_PAIRS = 5000 # Largest board a client may ask for (100x100)/Tablero más grande que un cliente puede pedir (100x100)
+MAX_LINE = 4096 # Longest request line/Línea de petición más larga
+
+
+class Session(asyncio.Protocol): # One client's connection and board, no task per client/La conexión y el tablero de un cliente, sin tarea por cliente
+    __slots__ = ('server', 'transport', 'buffer', 'engine', 'timer')
+
+    def __init__(self, server):
+        self.server = server
+        self.transport = None
+        self.buffer = b'' # Bytes of an incomplete line/Bytes de una línea incompleta
+        self.engine = None # Created by restart()/Creado por restart()
+        self.timer = None # Pending flip-back callback/Callback de volteo pendiente
+        self.restart()
+
+    # --- Connection/Conexión ---
+    def connection_made(self, transport):
+        self.transport = transport
+        self.server.sessions.add(self)
+
+    def connection_lost(self, exc):
+        self.cancel_timer()
+        self.server.sessions.discard(self)
+
+    def data_received(self, data):
+        lines = (self.buffer + data).split(b'\n')
+        self.buffer = lines.pop() # Keep the unfinished tail/Guardar el final incompleto
+        if len(self.buffer) > MAX_LINE: # Not a client of ours/No es un cliente nuestro
+            self.transport.close()
+            return
+        for line in lines:
+            self.server.requests += 1
+            try:
+                request = json.loads(line)
+                reply = self.handle(request) if isinstance(request, dict) else {'ok': False, 'error': "expected an object"}
+            except ValueError:
+                reply = {'ok': False, 'error': "invalid JSON"}
+            self.send(reply)
+
+    def send(self, message):
+        if not self.transport.is_closing():
+            self.transport.write(json.dumps(message, separators=(',', ':')).encode('utf-8') + b'\n')
+
+    # --- Game/Juego ---
+
+    def restart(self, seed=None, pairs=None):
+        self.cancel_timer()
+        self.engine = GameEngine(total_pairs=pairs or self.server.total_pairs, mismatch_delay=self.server.mismatch_delay,
+                                 seed=seed, clock=self.server.clock)
+
+    def cancel_timer(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+    def summary(self): # Fields shared by every reply/Campos comunes a todas las respuestas
+        engine = self.engine
+        return {'ok': True, 'pairs_found': engine.pairs_found, 'total_pairs': engine.total_pairs,
+                'block_input': engine.block_input, 'won': engine.is_won()}
+
+    def handle(self, request):
+        """Apply one request and return the reply
+        /Aplicar una petición y devolver la respuesta
+        """
+        op = request.get('op')
+        engine = self.engine
+        if op == 'flip':
+            slot = request.get('slot')
+            if not isinstance(slot, int) or isinstance(slot, bool) or not 0 <= slot < len(engine):
+                return {'ok': False, 'error': f"slot must be an integer in [0, {len(engine)})"}
+            matched = engine.pairs_found
+            flipped = engine.flip(slot)
+            reply = self.summary()
+            reply['flipped'] = flipped
+            if flipped: # Reveal the face only when it turned up/Revelar la cara solo si quedó boca arriba
+                reply['face'] = engine.pair_ids[slot]
+                reply['kind'] = KINDS[engine.kinds[slot]]
+                reply['match'] = True if engine.pairs_found > matched else (False if engine.block_input else None)
+                if engine.block_input: # Mismatch: schedule the flip-back instead of polling/No coinciden: programar el volteo en vez de sondear
+                    self.timer = asyncio.get_running_loop().call_later(engine.mismatch_delay / 1000, self.flip_back)
+            return reply
+        if op == 'state':
+            reply = self.summary()
+            reply['cards'] = len(engine)
+            reply['face_up'] = [[slot, engine.pair_ids[slot], KINDS[engine.kinds[slot]]]
+                                for slot, flags in enumerate(engine.state) if flags]
+            return reply
+        if op == 'restart':
+            seed, pairs = request.get('seed'), request.get('pairs')
+            if seed is not None and (not isinstance(seed, int) or isinstance(seed, bool)): # True is an int too/True también es un int
+                return {'ok': False, 'error': "seed must be an integer"}
+            if pairs is not None and (not isinstance(pairs, int) or isinstance(pairs, bool) or not 1 <= pairs <= MAX_PAIRS):
+                return {'ok': False, 'error': f"pairs must be an integer in [1, {MAX_PAIRS}]"}
+            self.restart(seed, pairs)
+            reply = self.summary()
+            reply['cards'] = len(self.engine)
+            reply['seed'] = self.engine.seed
+            return reply
+        return {'ok': False, 'error': f"unknown op: {op!r}"}
+
+    def flip_back(self): # Runs on the loop when the mismatch delay is over/Se ejecuta en el bucle al terminar el retraso
+        self.timer = None
+        slots = self.engine.update(self.engine.deadline()) # Exactly at the deadline, call_later may fire a little early/Justo en el límite, call_later puede dispararse un poco antes
+        if slots:
+            self.send({'event': 'flip_back', 'slots': list(slots)})
+
+
+class GameServer:
+    def __init__(self, total_pairs=None, mismatch_delay=None):
+        self.total_pairs = config.TOTAL_PAIRS if total_pairs is None else total_pairs # Default board/Tablero por defecto
+        self.mismatch_delay = config.MISMATCH_DELAY if mismatch_delay is None else mismatch_delay
+        self.sessions = set() # Live sessions/Sesiones activas
+        self.requests = 0 # Requests served/Peticiones atendidas
+        self._loop = None
+
+    def clock(self): # Loop time in ms, shared by every engine/Tiempo del bucle en ms, compartido por todos los motores
+        return int(self._loop.time() * 1000)
+
+    async def serve(self, host='127.0.0.1', port=8765, unix=None):
+        """Serve until cancelled
+        /Servir hasta que se cancele
+        """
+        self._loop = asyncio.get_running_loop()
+        if unix:
+            server = await self._loop.create_unix_server(lambda: Session(self), path=unix, backlog=4096)
+        else:
+            server = await self._loop.create_server(lambda: Session(self), host, port, backlog=4096)
+        try: # Stop cleanly when a service manager asks/Detenerse limpiamente cuando lo pide un gestor de servicios
+            self._loop.add_signal_handler(signal.SIGTERM, server.close)
+        except NotImplementedError: # Windows
+            pass
+        async with server:
+            await server.serve_forever()
+
+
+# --- LOAD GENERATOR/GENERADOR DE CARGA ---
+
+async def play(reader, writer, games, latencies, seed):
+    """Play full games on one connection with perfect memory, timing every request
+    /Jugar partidas completas en una conexión con memoria perfecta, midiendo cada petición
+    """
+    rng = random.Random(seed)
+
+    async def request(message): # Send and wait for the reply, skipping pushed events/Enviar y esperar la respuesta, saltando los eventos enviados
+        writer.write(json.dumps(message, separators=(',', ':')).encode('utf-8') + b'\n')
+        start = time.perf_counter()
+        while True:
+            reply = json.loads(await reader.readline())
+            if 'event' not in reply:
+                latencies.append((time.perf_counter() - start) * 1000)
+                return reply
+
+    async def wait_flip_back():
+        while 'event' not in json.loads(await reader.readline()):
+            pass
+
+    for _ in range(games):
+        cards = (await request({'op': 'restart', 'seed': rng.getrandbits(32)}))['cards']
+        unseen = list(range(cards))
+        rng.shuffle(unseen)
+        seen = {} # face -> slots seen face down/cara -> celdas vistas boca abajo
+        while True:
+            known = next((slots for slots in seen.values() if len(slots) == 2), None) # Both cards of a face already seen/Ambas cartas de una cara ya vistas
+            first = known[0] if known else unseen.pop()
+            face = (await request({'op': 'flip', 'slot': first}))['face']
+            if known:
+                second = known[1]
+            elif len(seen.get(face, ())) == 1: # Its partner was seen before/Su pareja se vio antes
+                second = seen[face][0]
+            else:
+                second = unseen.pop()
+            reply = await request({'op': 'flip', 'slot': second})
+            if reply['won']:
+                break
+            if reply['match']:
+                seen.pop(face, None)
+            else: # Remember both faces and wait for them to turn back/Recordar ambas caras y esperar a que se volteen
+                seen.setdefault(face, []).append(first)
+                seen.setdefault(reply['face'], []).append(second)
+                await wait_flip_back()
+
+
+async def load_test(sessions, games, host, port, unix, ramp):
+    latencies = []
+    errors = 0
+
+    async def client(i):
+        nonlocal errors
+        await asyncio.sleep(ramp * i / sessions) # Spread the connects/Repartir las conexiones
+        try:
+            if unix:
+                reader, writer = await asyncio.open_unix_connection(unix, limit=MAX_LINE)
+            else:
+                reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+        except OSError:
+            errors += 1
+            return
+        try:
+            await play(reader, writer, games, latencies, i)
+        except (OSError, ValueError, KeyError):
+            errors += 1
+        finally:
+            writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(i) for i in range(sessions)))
+    elapsed = time.perf_counter() - start
+    return {
+        'sessions': sessions,
+        'games': sessions * games,
+        'errors': errors,
+        'requests': len(latencies),
+        'elapsed_s': elapsed,
+        'requests_per_s': len(latencies) / elapsed if elapsed else 0.0,
+        'median_ms': statistics.median(latencies) if latencies else 0.0,
+        'p99_ms': percentile(latencies, 99),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve many memory game sessions, or load-test a server")
+    sub = parser.add_subparsers(dest='command', required=True)
+    for name in ('serve', 'loadgen'):
+        p = sub.add_parser(name)
+        p.add_argument('--host', default='127.0.0.1')
+        p.add_argument('--port', type=int, default=8765)
+        p.add_argument('--unix', help="Unix socket path instead of TCP")
+    s = sub.choices['serve']
+    s.add_argument('--pairs', type=int, default=config.TOTAL_PAIRS, help="pairs on a new board")
+    s.add_argument('--mismatch-delay', type=int, default=config.MISMATCH_DELAY, help="ms before mismatched cards flip back")
+    l = sub.choices['loadgen']
+    l.add_argument('--sessions', type=int, default=10000, help="concurrent connections")
+    l.add_argument('--games', type=int, default=1, help="games per connection")
+    l.add_argument('--ramp', type=float, default=2.0, help="seconds over which to open the connections")
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        server = GameServer(args.pairs, args.mismatch_delay)
+        print(f"Serving on {args.unix or f'{args.host}:{args.port}'}", file=sys.stderr)
+        try:
+            asyncio.run(server.serve(args.host, args.port, args.unix))
+        except (KeyboardInterrupt, asyncio.CancelledError): # Ctrl+C or SIGTERM
+            pass
+        finally:
+            if args.unix and os.path.exists(args.unix):
+                os.remove(args.unix)
+    else:
+        result = asyncio.run(load_test(args.sessions, args.games, args.host, args.port, args.unix, args.ramp))
+        print(json.dumps(result, indent=2))
+        if result['errors']:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+# --- SESSION RECORDING AND REPLAY/GRABACIÓN Y REPRODUCCIÓN DE SESIONES ---
+# main() records every board seed and every input that changes the game into a compact binary log
+# (MEMORY_RECORD=path). The log replays through MemoryGame with a virtual clock, headless at full
+# speed or in real time on screen, so field sessions become reproducible workloads.
+# /main() graba la semilla de cada tablero y cada entrada que cambia el juego en un registro binario
+# compacto (MEMORY_RECORD=ruta). El registro se reproduce en MemoryGame con un reloj virtual, sin
+# pantalla a máxima velocidad o en tiempo real, así las sesiones reales se vuelven cargas reproducibles.
+#
+# Replay/Reproducir: python -m src.session replay session.emgr [--realtime] [--json]
+# Layout/Formato: header (magic, version, rows, cols, face pool, mismatch delay, language) | records
+# Record/Registro: tick (ms, uint32), type (uint8), x, y (uint16) = 9 bytes
+import os
+import sys
+import time
+import struct
+from . import config
+
+MAGIC = b'EMGR'
+VERSION = 1
+HEADER = struct.Struct('<4sHHHHH2s') # magic, version, rows, cols, face pool, mismatch delay, language
+RECORD = struct.Struct('<IBHH') # tick, type, x, y
+
+# Record types/Tipos de registro
+START = 1 # New board; x, y = high and low 16 bits of its seed/Nuevo tablero; x, y = 16 bits altos y bajos de su semilla
+CLICK = 2 # Left click on the board at (x, y)/Clic izquierdo en el tablero en (x, y)
+FLIP_BACK = 3 # Mismatched cards turned face down/Las cartas no coincidentes se voltearon
+LANGUAGE = 4 # Language toggled/Se cambió el idioma
+WIN = 5 # All pairs found/Todos los pares encontrados
+MENU = 6 # Back to the main menu/De vuelta al menú principal
+RESIZE = 7 # Window resized to (x, y) = (width, height); clicks after it use the new layout/La ventana cambió a (ancho, alto); los clics posteriores usan la nueva disposición
+NAMES = {START: 'start', CLICK: 'click', FLIP_BACK: 'flip_back', LANGUAGE: 'language', WIN: 'win', MENU: 'menu',
+         RESIZE: 'resize'}
+
+
+class Recorder: # Appends records in memory and writes the file on close/Agrega registros en memoria y escribe el archivo al cerrar
+    def __init__(self, path, clock):
+        """
+        path: output file/archivo de salida
+        clock: callable returning the current time in ms (pygame.time.get_ticks)/función que devuelve el tiempo actual en ms
+        """
+        self.path = path
+        self.clock = clock
+        self._data = bytearray(HEADER.pack(MAGIC, VERSION, config.GRID_ROWS, config.GRID_COLS, config.FACE_POOL_SIZE,
+                                           config.MISMATCH_DELAY, config.LANGUAGE.encode('ascii')))
+
+    @classmethod
+    def from_env(cls, clock): # A recorder if MEMORY_RECORD is set, else None/Un grabador si MEMORY_RECORD está definido, si no None
+        path = os.environ.get('MEMORY_RECORD')
+        return cls(path, clock) if path else None
+
+    def record(self, kind, x=0, y=0):
+        self._data += RECORD.pack(self.clock(), kind, x, y)
+
+    def start(self, seed): # A new board, identified by its seed/Un tablero nuevo, identificado por su semilla
+        if not isinstance(seed, int) or not 0 <= seed < 1 << 32:
+            raise ValueError(f"Only 32-bit integer seeds can be recorded: {seed!r}")
+        self.record(START, seed >> 16, seed & 0xFFFF)
+
+    def close(self):
+        tmp = self.path + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(self._data)
+        os.replace(tmp, self.path) # Never leave a half-written log/Nunca dejar un registro a medio escribir
+
+
+def load(path):
+    """Read a session log, returning (header dict, list of (tick, type, x, y))
+    /Leer un registro de sesión, devolviendo (diccionario de cabecera, lista de (tick, tipo, x, y))
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    magic, version, rows, cols, face_pool, delay, language = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Not a session log (version {VERSION}): {path}")
+    header = {'rows': rows, 'cols': cols, 'face_pool': face_pool, 'mismatch_delay': delay,
+              'language': language.decode('ascii')}
+    return header, list(RECORD.iter_unpack(memoryview(data)[HEADER.size:]))
+
+
+class VirtualClock: # Time that only moves when the replay sets it/Tiempo que solo avanza cuando la reproducción lo fija
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+def replay(path, realtime=False):
+    """Feed a session log back through MemoryGame, returning one summary per board
+    /Alimentar un registro de sesión a MemoryGame, devolviendo un resumen por tablero
+
+    realtime: wait for each record's tick and draw the board, else run headless at full speed
+    /esperar el tick de cada registro y dibujar el tablero, si no ejecutar sin pantalla a máxima velocidad
+    """
+    import pygame
+    from .engine import GameEngine
+    from .game import MemoryGame, FLIP_BACK_EVENT
+
+    header, records = load(path)
+    config.set_grid_size(header['rows'], header['cols'])
+    config.FACE_POOL_SIZE = header['face_pool']
+    config.MISMATCH_DELAY = header['mismatch_delay']
+    config.LANGUAGE = header['language']
+
+    pygame.init()
+    screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT)) # Faces are converted to the display format (the dummy driver when headless)/Las caras se convierten al formato de pantalla (el controlador dummy sin pantalla)
+    fps = pygame.time.Clock()
+    clock = VirtualClock()
+    boards = []
+    game = None
+    start = time.perf_counter()
+
+    for tick, kind, x, y in records:
+        if realtime: # Keep drawing until the record is due/Seguir dibujando hasta que toque el registro
+            while (time.perf_counter() - start) * 1000 < tick - records[0][0]:
+                clock.now = records[0][0] + int((time.perf_counter() - start) * 1000) # Animations follow the wall clock/Las animaciones siguen al reloj real
+                pygame.event.pump()
+                if game is not None:
+                    screen.fill(config.GRAY)
+                    game.draw(screen)
+                pygame.display.flip()
+                fps.tick(config.FPS)
+        clock.now = tick
+
+        if kind == START:
+            seed = (x << 16) | y
+            game = MemoryGame(engine=GameEngine(seed=seed, clock=clock))
+            boards.append({'seed': seed, 'start_tick': tick, 'clicks': 0, 'flip_backs': 0,
+                           'pairs_found': 0, 'won': False, 'diverged': False})
+        elif kind == LANGUAGE:
+            config.LANGUAGE = 'es' if config.LANGUAGE == 'en' else 'en'
+            if game is not None:
+                game.update_language()
+        elif kind == RESIZE:
+            config.set_screen_size(x, y)
+            screen = pygame.display.set_mode((x, y))
+            if game is not None:
+                game.relayout()
+        elif game is None: # Input before any board (truncated log)/Entrada antes de cualquier tablero (registro truncado)
+            continue
+        elif kind == CLICK:
+            game.handle_click((x, y))
+            boards[-1]['clicks'] += 1
+        elif kind == FLIP_BACK:
+            if not game.update(): # The recorded flip-back did not happen here/El volteo grabado no ocurrió aquí
+                boards[-1]['diverged'] = True
+            boards[-1]['flip_backs'] += 1
+        elif kind == WIN:
+            boards[-1]['won'] = game.engine.is_won()
+            if not boards[-1]['won']: # The recorded win did not happen here/La victoria grabada no ocurrió aquí
+                boards[-1]['diverged'] = True
+        if game is not None:
+            boards[-1]['pairs_found'] = game.engine.pairs_found
+            boards[-1]['ticks'] = tick - boards[-1]['start_tick']
+
+    pygame.time.set_timer(FLIP_BACK_EVENT, 0) # handle_click arms real timers/handle_click arma temporizadores reales
+    elapsed = time.perf_counter() - start
+    pygame.quit()
+    return {'records': len(records), 'elapsed_s': elapsed, 'records_per_s': len(records) / elapsed if elapsed else 0.0,
+            'boards': boards}
+
+
+def main():
+    import json, argparse # Command line only, the game just records/Solo para la línea de comandos, el juego solo graba
+    parser = argparse.ArgumentParser(description="Inspect or replay a recorded session")
+    sub = parser.add_subparsers(dest='command', required=True)
+    r = sub.add_parser('replay')
+    r.add_argument('path')
+    r.add_argument('--realtime', action='store_true', help="replay at the recorded pace on screen")
+    r.add_argument('--json', action='store_true', help="print the summary as JSON")
+    i = sub.add_parser('info')
+    i.add_argument('path')
+    args = parser.parse_args()
+
+    if args.command == 'info':
+        header, records = load(args.path)
+        print(json.dumps(header))
+        for tick, kind, x, y in records:
+            print(tick, NAMES.get(kind, kind), x, y)
+        return
+
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1") # Keep stdout clean for --json/Mantener stdout limpio para --json
+    if not args.realtime:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # No window needed/No se necesita ventana
+    result = replay(args.path, realtime=args.realtime)
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        for board in result['boards']:
+            print(f"seed {board['seed']}: {board['clicks']} clicks, {board['pairs_found']} pairs, "
+                  f"{'won' if board['won'] else 'unfinished'} in {board.get('ticks', 0)} ms"
+                  f"{' DIVERGED' if board['diverged'] else ''}")
+        print(f"{result['records']} records in {result['elapsed_s'] * 1000:.1f} ms "
+              f"({result['records_per_s']:.0f} records/s)")
+    if any(board['diverged'] for board in result['boards']):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
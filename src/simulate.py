@@ -0,0 +1,420 @@
+# --- BATCH SIMULATOR/SIMULADOR POR LOTES ---
+# Plays thousands of boards at once with NumPy to tune difficulty (grid size, flip-back delay, pairs).
+# Requires numpy (pip install numpy); the game itself does not.
+# /Juega miles de tableros a la vez con NumPy para ajustar la dificultad (tamaño, retraso, pares).
+# Requiere numpy (pip install numpy); el juego en sí no.
+#
+# Throughput on one core, 10 pairs, per million boards: perfect about 2 s, limited:5 about 6-7 s,
+# random about 6-8 s (it needs about 100 turns per board, perfect about 16). --workers splits the
+# boards across cores.
+# /Rendimiento en un núcleo, 10 pares, por millón de tableros: perfect unos 2 s, limited:5 unos
+# 6-7 s, random unos 6-8 s (necesita unos 100 turnos por tablero, perfect unos 16). --workers
+# reparte los tableros entre núcleos.
+#
+# Usage/Uso: python -m src.simulate --boards 1000000 --pairs 10 --strategy perfect --workers 4
+# Check/Verificar: python -m src.simulate --verify 500 --strategy random   (replays boards through GameEngine/reproduce tableros en GameEngine)
+import sys
+import argparse
+import time
+import numpy as np
+from . import config
+
+# The rules match GameEngine.check_match: two cards match when their faces are equal, a match stays
+# face up, a mismatch flips back after the mismatch delay (input blocked meanwhile).
+# /Las reglas coinciden con GameEngine.check_match: dos cartas son par si sus caras son iguales, un par
+# queda boca arriba, una no coincidencia se voltea tras el retraso (con la entrada bloqueada).
+
+class BatchState: # N dealt boards, stored flat so a (board, card) lookup is one index/N tableros repartidos, en plano para que (tablero, carta) sea un solo índice
+    def __init__(self, n_boards, total_pairs, face_pool, rng):
+        self.cards = total_pairs * 2
+        deck = np.arange(total_pairs, dtype=np.int32) % face_pool # Faces of each pair, like GameEngine/Caras de cada par, como GameEngine
+        deck = np.repeat(deck, 2) # A symbol and a text card per pair/Una carta de símbolo y una de texto por par
+        self.faces = rng.permuted(np.broadcast_to(deck, (n_boards, self.cards)), axis=1).astype(np.int16) # Shuffled board per row/Tablero mezclado por fila
+        self.flat_faces = self.faces.ravel() # Face of card c on board b at b * cards + c/Cara de la carta c del tablero b en b * cards + c
+        self.face_pool = face_pool
+        self.turn = 0 # Turns played so far/Turnos jugados hasta ahora
+
+    def __len__(self):
+        return self.faces.shape[0]
+
+
+class CardPool:
+    """A set of cards per board with O(1) draw, remove and add: the members are packed at the
+    front of each board's `order` row, and `pos` says where each card sits
+    /Un conjunto de cartas por tablero con sorteo, quita y agregado O(1): los miembros están
+    al frente de la fila `order` de cada tablero, y `pos` dice dónde está cada carta
+
+    Every call takes `rows` (distinct boards) and `base` (rows * cards)/Cada llamada recibe `rows` (tableros distintos) y `base` (rows * cards)
+    """
+    def __init__(self, n_boards, cards):
+        self.order = np.tile(np.arange(cards, dtype=np.int32), n_boards) # All cards to start with/Todas las cartas al principio
+        self.pos = self.order.copy()
+        self.size = np.full(n_boards, cards, dtype=np.int32) # Members per board/Miembros por tablero
+
+    def draw(self, rng, rows, base): # A uniformly random member per board/Un miembro al azar por tablero
+        k = (rng.random(len(rows)) * self.size[rows]).astype(np.intp)
+        return self.order[base + k]
+
+    def remove(self, rows, base, cards): # Move the last member into the removed card's place/Mover el último miembro al lugar de la carta quitada
+        at = self.pos[base + cards]
+        last = self.size[rows] - 1
+        moved = self.order[base + last]
+        self.order[base + at] = moved
+        self.pos[base + moved] = at
+        self.size[rows] = last
+
+    def add(self, rows, base, cards):
+        end = self.size[rows]
+        self.order[base + end] = cards
+        self.pos[base + cards] = end
+        self.size[rows] = end + 1
+
+
+class UnseenCards:
+    """The unknown cards of a player who never forgets: the ones not seen yet. The deal is a uniform
+    shuffle, so exploring them left to right plays exactly like picking one at random
+    /Las cartas desconocidas de un jugador que nunca olvida: las aún no vistas. El reparto es una
+    mezcla uniforme, así explorarlas de izquierda a derecha juega igual que elegir una al azar
+    """
+    def __init__(self, n_boards, cards):
+        self.next = np.zeros(n_boards, dtype=np.int32) # First unseen card per board/Primera carta no vista por tablero
+
+    def draw(self, rng, rows, base):
+        return self.next[rows]
+
+    def remove(self, rows, base, cards): # Always the card just drawn/Siempre la carta recién sorteada
+        self.next[rows] += 1
+
+
+# --- STRATEGIES/ESTRATEGIAS ---
+# A strategy makes a player per batch. player.choose(rows, base, rng) -> (first, second) picks the
+# cards of the live boards; player.observe(rows, base, cards, faces, match) tells it what it saw.
+# Players keep their memory incrementally, so a turn costs O(boards), not O(boards * cards).
+# /Una estrategia crea un jugador por lote. player.choose(rows, base, rng) -> (primera, segunda)
+# elige las cartas de los tableros vivos; player.observe(...) le dice lo que vio. Los jugadores
+# actualizan su memoria de forma incremental, así un turno cuesta O(tableros), no O(tableros * cartas).
+
+class RandomStrategy: # No memory: flips two random unmatched cards/Sin memoria: voltea dos cartas al azar no emparejadas
+    name = 'random'
+
+    def new_player(self, state):
+        return RandomPlayer(state)
+
+
+class RandomPlayer:
+    def __init__(self, state):
+        self.unmatched = CardPool(len(state), state.cards)
+
+    def choose(self, rows, base, rng):
+        size = self.unmatched.size[rows]
+        r = rng.random((2, len(rows)))
+        i = (r[0] * size).astype(np.intp)
+        j = (r[1] * (size - 1)).astype(np.intp) # Any other member/Cualquier otro miembro
+        j += j >= i
+        order = self.unmatched.order
+        return order[base + i], order[base + j]
+
+    def observe(self, rows, base, cards, faces, match):
+        first, second = cards
+        hit = np.flatnonzero(match) # Usually a few boards: index them, don't mask/Normalmente pocos tableros: indexarlos, no enmascarar
+        rows, base = rows[hit], base[hit]
+        self.unmatched.remove(rows, base, first[hit])
+        self.unmatched.remove(rows, base, second[hit])
+
+
+class MemoryStrategy:
+    """Remembers revealed cards (all of them, or only those seen in the last `span` turns),
+    takes a known pair when it has one, otherwise explores an unknown card and pairs it if it can.
+    /Recuerda las cartas reveladas (todas, o solo las vistas en los últimos `span` turnos), toma un
+    par conocido si lo tiene, si no explora una carta desconocida y la empareja si puede.
+    """
+    def __init__(self, span=None):
+        self.span = span # Turns a card stays remembered, None for perfect memory/Turnos que se recuerda una carta, None para memoria perfecta
+        self.name = 'perfect' if span is None else f'limited:{span}'
+
+    def new_player(self, state):
+        if self.span is not None and self.span <= 1: # Nothing is remembered into the next turn: random play/No se recuerda nada para el turno siguiente: juego al azar
+            return RandomPlayer(state)
+        return MemoryPlayer(state, self.span)
+
+
+class MemoryPlayer:
+    # Without a known pair at the start of a turn, every face with unmatched cards has an unknown one,
+    # so at most two cards per face are remembered and at most one face per board has both.
+    # /Sin un par conocido al empezar el turno, cada cara con cartas sin emparejar tiene una
+    # desconocida, así se recuerdan como mucho dos cartas por cara y como mucho una cara por tablero tiene las dos.
+    def __init__(self, state, span):
+        n = len(state)
+        self.state = state
+        # Unmatched cards not remembered/Cartas sin emparejar no recordadas
+        self.unknown = UnseenCards(n, state.cards) if span is None else CardPool(n, state.cards)
+        self.known_a = np.full(n * state.face_pool, -1, dtype=np.int32) # Remembered card per (board, face), -1 if none/Carta recordada por (tablero, cara)
+        self.known_b = self.known_a.copy() # A second one: a known pair/Una segunda: un par conocido
+        self.pair_face = np.full(n, -1, dtype=np.int32) # Face of the known pair, -1 if none/Cara del par conocido
+        # Cards seen at turn t are forgotten at the end of turn t + span - 1; the ring keeps the
+        # last span - 1 turns of newly remembered cards (None: never forget)
+        # /Las cartas vistas en el turno t se olvidan al final del turno t + span - 1; el anillo guarda
+        # las cartas recordadas en los últimos span - 1 turnos (None: nunca olvidar)
+        self.ring = None if span is None else np.full((span - 1, 2, n), -1, dtype=np.int32)
+
+    def choose(self, rows, base, rng):
+        state = self.state
+        first = np.empty(len(rows), dtype=np.int32)
+        second = np.empty(len(rows), dtype=np.int32)
+        pair_face = self.pair_face[rows]
+
+        # 1. A remembered pair/Un par recordado
+        paired = np.flatnonzero(pair_face >= 0)
+        key = rows[paired] * state.face_pool + pair_face[paired]
+        first[paired] = self.known_a[key]
+        second[paired] = self.known_b[key]
+
+        # 2. Explore an unknown card, then pair it from memory or explore again
+        # /Explorar una carta desconocida, luego emparejarla de memoria o explorar otra vez
+        explore = np.flatnonzero(pair_face < 0)
+        rows, base = rows[explore], base[explore]
+        card = self.unknown.draw(rng, rows, base)
+        self.unknown.remove(rows, base, card)
+        partner = self.known_a[rows * state.face_pool + state.flat_faces[base + card]]
+        again = np.flatnonzero(partner < 0)
+        rows, base = rows[again], base[again]
+        partner[again] = self.unknown.draw(rng, rows, base)
+        self.unknown.remove(rows, base, partner[again])
+        first[explore] = card
+        second[explore] = partner
+        return first, second
+
+    def observe(self, rows, base, cards, faces, match):
+        state = self.state
+        first, second = cards
+        # A match used up what was remembered of its face; after a mismatch nothing was remembered
+        # of the first card's face either (it had no partner), so every board is cleared the same way
+        # /Un par agota lo recordado de su cara; tras una no coincidencia tampoco se recordaba nada de
+        # la cara de la primera carta (no tenía pareja), así todos los tableros se limpian igual
+        key = rows * state.face_pool + faces[0]
+        self.known_a[key] = -1
+        self.known_b[key] = -1
+        self.pair_face[rows] = -1
+
+        # A mismatch only happens after two explored cards of different faces: remember both
+        # /Una no coincidencia solo ocurre tras explorar dos cartas de caras distintas: recordar ambas
+        missed = np.flatnonzero(~match)
+        new_rows, new_base = rows[missed], base[missed]
+        new_first, new_second = first[missed], second[missed]
+        self.known_a[key[missed]] = new_first
+        key = new_rows * state.face_pool + faces[1][missed]
+        known = self.known_a[key]
+        pair = known >= 0 # The second card of a face: a pair to take next turn/La segunda carta de una cara: un par para el próximo turno
+        self.known_a[key] = np.where(pair, known, new_second)
+        self.known_b[key] = np.where(pair, new_second, -1)
+        self.pair_face[new_rows] = np.where(pair, faces[1][missed], -1)
+
+        if self.ring is None:
+            return
+        slot = self.ring[state.turn % len(self.ring)]
+        for old in slot: # Remembered span - 1 turns ago/Recordadas hace span - 1 turnos
+            self.forget(rows, base, old[rows])
+        slot[:, rows] = -1
+        slot[0, new_rows] = new_first
+        slot[1, new_rows] = new_second
+
+    def forget(self, rows, base, cards): # Cards matched since (or -1) are skipped/Se saltan las cartas emparejadas desde entonces (o -1)
+        keep = np.flatnonzero(cards >= 0)
+        rows, base, cards = rows[keep], base[keep], cards[keep]
+        faces = self.state.flat_faces[base + cards]
+        key = rows * self.state.face_pool + faces
+        known_a, known_b = self.known_a[key], self.known_b[key]
+        in_a = known_a == cards
+        gone = np.flatnonzero(in_a | (known_b == cards))
+        self.known_a[key] = np.where(in_a, known_b, known_a) # The other card of the face, if any, moves up/La otra carta de la cara, si hay, sube
+        self.known_b[key[gone]] = -1
+        rows, base, cards, faces = rows[gone], base[gone], cards[gone], faces[gone]
+        self.pair_face[rows] = np.where(self.pair_face[rows] == faces, -1, self.pair_face[rows])
+        self.unknown.add(rows, base, cards)
+
+
+def get_strategy(name):
+    """Build a strategy from its name: 'random', 'perfect' or 'limited:<turns>'
+    /Crear una estrategia a partir de su nombre: 'random', 'perfect' o 'limited:<turnos>'
+    """
+    if name == 'random':
+        return RandomStrategy()
+    if name == 'perfect':
+        return MemoryStrategy()
+    if name.startswith('limited:'):
+        return MemoryStrategy(span=int(name.split(':', 1)[1]))
+    raise ValueError(f"Unknown strategy: {name}")
+
+
+# --- SIMULATION/SIMULACIÓN ---
+
+def simulate_chunk(n_boards, total_pairs, strategy, seed=None, face_pool=None,
+                   mismatch_delay=None, turn_time=1000, max_turns=None, trace=False):
+    """Play n_boards games to the end and return per-board statistics
+    /Jugar n_boards partidas hasta el final y devolver estadísticas por tablero
+
+    Returns a dict of arrays/Devuelve un dict de arreglos:
+        moves: turns (two flips) needed to win/turnos (dos volteos) para ganar
+        mismatches: turns that did not find a pair/turnos sin encontrar par
+        time_ms: simulated time, turn_time per turn plus the flip-back delay per mismatch
+                 /tiempo simulado, turn_time por turno más el retraso por cada no coincidencia
+        faces, turns: with trace, the dealt boards and every turn as (boards, first, second)
+                      /con trace, los tableros repartidos y cada turno como (tableros, primera, segunda)
+    """
+    if isinstance(strategy, str):
+        strategy = get_strategy(strategy)
+    face_pool = min(config.FACE_POOL_SIZE if face_pool is None else face_pool, total_pairs)
+    mismatch_delay = config.MISMATCH_DELAY if mismatch_delay is None else mismatch_delay
+    max_turns = total_pairs * total_pairs * 50 if max_turns is None else max_turns # Safety stop for random play/Parada de seguridad para juego aleatorio
+
+    rng = np.random.default_rng(seed)
+    state = BatchState(n_boards, total_pairs, face_pool, rng)
+    player = strategy.new_player(state)
+    dealt = state.faces.copy() if trace else None
+    turns = []
+    left = np.full(n_boards, total_pairs, dtype=np.int32) # Pairs still face down per board/Pares aún boca abajo por tablero
+    moves = np.zeros(n_boards, dtype=np.int32)
+    rows = np.arange(n_boards) # Boards still playing/Tableros que siguen jugando
+    base = rows * state.cards
+
+    while len(rows) and state.turn < max_turns:
+        first, second = player.choose(rows, base, rng)
+        faces = state.flat_faces[base + first], state.flat_faces[base + second]
+        match = faces[0] == faces[1] # Same rule as check_match/Misma regla que check_match
+        player.observe(rows, base, (first, second), faces, match)
+        if trace:
+            turns.append((rows, first, second))
+        state.turn += 1
+
+        hit = np.flatnonzero(match)
+        matched = rows[hit]
+        left[matched] -= 1
+        won = hit[left[matched] == 0] # Only a match can finish a board/Solo un par puede terminar un tablero
+        if len(won):
+            moves[rows[won]] = state.turn
+            rows, base = np.delete(rows, won), np.delete(base, won) # A copy, not a pass over every board/Una copia, no una pasada por cada tablero
+
+    moves[rows] = state.turn # Stopped by max_turns/Detenidos por max_turns
+    mismatches = moves - (total_pairs - left) # Every other turn found a pair/Cada otro turno encontró un par
+    result = {
+        'moves': moves,
+        'mismatches': mismatches,
+        'time_ms': moves.astype(np.int64) * turn_time + mismatches.astype(np.int64) * mismatch_delay,
+    }
+    if trace:
+        result['faces'] = dealt
+        result['turns'] = turns
+    return result
+
+
+def _run_chunk(args): # Worker entry point for process sharding/Punto de entrada del proceso trabajador
+    n_boards, total_pairs, strategy, seed, kwargs = args
+    return simulate_chunk(n_boards, total_pairs, strategy, seed=seed, **kwargs)
+
+
+def simulate(n_boards, total_pairs=None, strategy='perfect', seed=None, chunk_size=16384, workers=1, **kwargs):
+    """Simulate n_boards games in chunks, optionally sharded across worker processes
+    /Simular n_boards partidas en bloques, opcionalmente repartidas entre procesos
+
+    strategy: a name accepted by get_strategy (needed for workers > 1) or a strategy object
+              /un nombre aceptado por get_strategy (necesario con workers > 1) o un objeto estrategia
+    """
+    total_pairs = config.TOTAL_PAIRS if total_pairs is None else total_pairs
+    sizes = [min(chunk_size, n_boards - start) for start in range(0, n_boards, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes)) # Independent streams per chunk/Flujos independientes por bloque
+    jobs = [(size, total_pairs, strategy, s, kwargs) for size, s in zip(sizes, seeds)]
+
+    if workers > 1:
+        from multiprocessing import Pool
+        with Pool(workers) as pool:
+            parts = pool.map(_run_chunk, jobs)
+    else:
+        parts = [_run_chunk(job) for job in jobs]
+
+    return {key: np.concatenate([part[key] for part in parts]) for key in ('moves', 'mismatches', 'time_ms')}
+
+
+def verify(n_boards, total_pairs=None, strategy='perfect', seed=None, **kwargs):
+    """Replay simulated boards turn by turn through GameEngine and return the boards where the
+    engine disagrees (an illegal flip, a different match, or a different number of moves or mismatches)
+    /Reproducir tableros simulados turno a turno en GameEngine y devolver los tableros donde el motor
+    no coincide (un volteo ilegal, otro resultado de par, u otra cantidad de turnos o no coincidencias)
+    """
+    from array import array
+    from .engine import GameEngine
+
+    total_pairs = config.TOTAL_PAIRS if total_pairs is None else total_pairs
+    face_pool = min(config.FACE_POOL_SIZE if kwargs.get('face_pool') is None else kwargs['face_pool'], total_pairs)
+    result = simulate_chunk(n_boards, total_pairs, strategy, seed=seed, trace=True, **kwargs)
+
+    engines = []
+    for faces in result['faces']:
+        engine = GameEngine(total_pairs=total_pairs, face_pool=face_pool, seed=0, clock=lambda: 0)
+        engine.pair_ids = array('H', faces.tolist()) # Deal the simulated board/Repartir el tablero simulado
+        engines.append(engine)
+    moves = [0] * n_boards
+    mismatches = [0] * n_boards
+    failed = set()
+
+    for boards, first, second in result['turns']:
+        for board, a, b in zip(boards.tolist(), first.tolist(), second.tolist()):
+            engine = engines[board]
+            if not (engine.flip(a) and engine.flip(b)): # The simulator flipped a card the engine refuses/El simulador volteó una carta que el motor rechaza
+                failed.add(board)
+            moves[board] += 1
+            if engine.block_input:
+                mismatches[board] += 1
+                engine.update(engine.deadline()) # Skip the flip-back delay/Saltar el retraso de volteo
+
+    for board, engine in enumerate(engines):
+        if (not engine.is_won() or moves[board] != result['moves'][board]
+                or mismatches[board] != result['mismatches'][board]):
+            failed.add(board)
+    return sorted(failed)
+
+
+def summarize(result): # Mean and percentiles of each statistic/Media y percentiles de cada estadística
+    return {
+        key: {
+            'mean': float(values.mean()),
+            'p50': float(np.percentile(values, 50)),
+            'p90': float(np.percentile(values, 90)),
+            'max': int(values.max()),
+        }
+        for key, values in result.items()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate many memory games at once")
+    parser.add_argument('--boards', type=int, default=100000)
+    parser.add_argument('--pairs', type=int, default=config.TOTAL_PAIRS)
+    parser.add_argument('--strategy', default='perfect', help="random, perfect or limited:<turns>")
+    parser.add_argument('--delay', type=int, default=config.MISMATCH_DELAY, help="flip-back delay in ms")
+    parser.add_argument('--turn-time', type=int, default=1000, help="ms a player spends per turn")
+    parser.add_argument('--chunk', type=int, default=16384, help="boards played together (small enough to stay in cache)")
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--verify', type=int, default=0, metavar='BOARDS',
+                        help="replay this many boards through GameEngine and exit 1 if any disagree")
+    args = parser.parse_args()
+
+    if args.verify:
+        failed = verify(args.verify, args.pairs, args.strategy, seed=args.seed, mismatch_delay=args.delay)
+        print(f"verified {args.verify} boards against GameEngine: {len(failed)} disagree")
+        if failed:
+            print(f"  first boards: {failed[:10]}")
+            sys.exit(1)
+        return
+
+    start = time.perf_counter()
+    result = simulate(args.boards, args.pairs, args.strategy, seed=args.seed, chunk_size=args.chunk,
+                      workers=args.workers, mismatch_delay=args.delay, turn_time=args.turn_time)
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.boards} boards, {args.pairs} pairs, {args.strategy}: {elapsed:.2f}s")
+    for key, stats in summarize(result).items():
+        print(f"  {key:>10}: mean {stats['mean']:.1f}  p50 {stats['p50']:.0f}  p90 {stats['p90']:.0f}  max {stats['max']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# --- SPATIAL INDEXES/ÍNDICES ESPACIALES ---
+# Constant-time point lookups so clicks do not scan every card or button
+# /Búsquedas de puntos en tiempo constante para que los clics no recorran todas las cartas o botones
+
+class GridIndex: # Regular grid of equal cells separated by a gap (the card board)/Cuadrícula regular de celdas iguales separadas por un espacio (el tablero)
+    def __init__(self, x, y, cell_width, cell_height, gap, rows, cols):
+        self.x = x # Left edge of the first column/Borde izquierdo de la primera columna
+        self.y = y # Top edge of the first row/Borde superior de la primera fila
+        self.cell_width = cell_width # Width of each cell/Ancho de cada celda
+        self.cell_height = cell_height # Height of each cell/Alto de cada celda
+        self.gap = gap # Space between cells/Espacio entre celdas
+        self.rows = rows # Number of rows/Número de filas
+        self.cols = cols # Number of columns/Número de columnas
+
+    def cell_at(self, pos):
+        """Get the (row, col) under a point, or None in the gaps and outside the grid
+        /Obtener la (fila, columna) bajo un punto, o None en los espacios y fuera de la cuadrícula
+        """
+        px = pos[0] - self.x
+        py = pos[1] - self.y
+        if px < 0 or py < 0: # Left of or above the grid/A la izquierda o encima de la cuadrícula
+            return None
+        col, offset_x = divmod(px, self.cell_width + self.gap) # Column and position inside its cell+gap span/Columna y posición dentro de su celda+espacio
+        row, offset_y = divmod(py, self.cell_height + self.gap)
+        if col >= self.cols or row >= self.rows: # Right of or below the grid/A la derecha o debajo de la cuadrícula
+            return None
+        if offset_x >= self.cell_width or offset_y >= self.cell_height: # In the gap between cells/En el espacio entre celdas
+            return None
+        return int(row), int(col)
+
+    def index_at(self, pos): # Get the row-major index under a point, or None/Obtener el índice por filas bajo un punto, o None
+        cell = self.cell_at(pos)
+        if cell is None:
+            return None
+        return cell[0] * self.cols + cell[1]
+
+
+class RectIndex: # Buckets arbitrary rects (buttons, labels) in a coarse uniform grid/Agrupa rectángulos arbitrarios (botones, etiquetas) en una cuadrícula uniforme
+    def __init__(self, bucket_size=64):
+        self.bucket_size = bucket_size # Side of each bucket in pixels/Lado de cada cubeta en píxeles
+        self._buckets = {} # (bx, by) -> [(rect, item), ...]
+
+    def add(self, rect, item): # Register an item in every bucket its rect touches/Registrar un elemento en cada cubeta que toca su rectángulo
+        size = self.bucket_size
+        for bx in range(rect.left // size, (rect.right - 1) // size + 1):
+            for by in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                self._buckets.setdefault((bx, by), []).append((rect, item))
+
+    def clear(self): # Forget every item (e.g. after a relayout)/Olvidar todos los elementos (p. ej. tras reacomodar)
+        self._buckets.clear()
+
+    def item_at(self, pos):
+        """Get the item whose rect contains the point, or None
+        /Obtener el elemento cuyo rectángulo contiene el punto, o None
+        """
+        bucket = self._buckets.get((int(pos[0]) // self.bucket_size, int(pos[1]) // self.bucket_size))
+        if bucket:
+            for rect, item in bucket: # Only the few rects sharing this bucket/Solo los pocos rectángulos en esta cubeta
+                if rect.collidepoint(pos):
+                    return item
+        return None
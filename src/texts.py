@@ -0,0 +1,62 @@
+import threading
+from . import config
+from . import fonts
+from .lru import SurfaceLRU
+
+# --- RENDERED TEXT CACHE/CACHÉ DE TEXTOS RENDERIZADOS ---
+# Every string from TEXTS and _COMPONENTS is rendered once per (key, language, font, color), so
+# switching the language only swaps which surface is shown. Font sizes follow the window, so the
+# store is an LRU with a memory cap.
+# /Cada cadena de TEXTS y _COMPONENTS se renderiza una vez por (clave, idioma, fuente, color), así
+# cambiar el idioma solo cambia qué superficie se muestra. Los tamaños siguen a la ventana, así que
+# el almacén es un LRU con límite de memoria.
+
+class TextCache:
+    def __init__(self, max_bytes=config.TEXT_CACHE_BYTES):
+        self._surfaces = SurfaceLRU(max_bytes=max_bytes) # (table, key, language, font, color) -> Surface
+        self._specs = set() # (table, key, font, color) requested so far, to warm the other languages/Pedidos hasta ahora, para precargar los otros idiomas
+        self.renders = 0 # Texts actually rendered/Textos realmente renderizados
+        self._lock = threading.Lock() # Card faces may be looked up from the prefetch thread/Las caras pueden pedirse desde el hilo de precarga
+
+    def get(self, text_key, font, color, language=None):
+        """Get a TEXTS entry rendered with font (family, size, bold) and color
+        /Obtener una entrada de TEXTS renderizada con la fuente (familia, tamaño, negrita) y el color
+        """
+        return self._lookup('text', text_key, font, color, language or config.LANGUAGE)
+
+    def component(self, index, font, color, language=None): # Same for a component name/Igual para un nombre de componente
+        return self._lookup('component', index, font, color, language or config.LANGUAGE)
+
+    def _lookup(self, table, key, font, color, language):
+        cache_key = (table, key, language, font, color)
+        with self._lock: # The LRU reorders itself on every read/El LRU se reordena en cada lectura
+            surf = self._surfaces.get(cache_key)
+        if surf is None:
+            if table == 'text':
+                text = config.get_text(key, language)
+            else:
+                text = config.get_component_name(key, language)
+            surf = fonts.get_font(*font).render(text, True, color)
+            with self._lock:
+                self.renders += 1
+                self._surfaces.put(cache_key, surf)
+                self._specs.add((table, key, font, color))
+        return surf
+
+    def warm(self, languages=None):
+        """Render every text requested so far in every language (main thread only)
+        /Renderizar cada texto pedido hasta ahora en todos los idiomas (solo hilo principal)
+        """
+        for table, key, font, color in list(self._specs):
+            for language in languages or config.TEXTS:
+                self._lookup(table, key, font, color, language)
+
+    def clear(self): # Drop every surface (needed if pygame.font is re-initialized)/Descartar todas las superficies (necesario si se reinicia pygame.font)
+        self._surfaces.clear()
+        self._specs.clear()
+
+    def __len__(self):
+        return len(self._surfaces)
+
+
+text_cache = TextCache() # Shared instance used by the UI and the card faces/Instancia compartida usada por la interfaz y las caras
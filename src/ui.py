@@ -1,35 +1,81 @@
 import pygame
 from . import config
+from .texts import text_cache
+from .spatial import RectIndex
 
 # --- UI COMPONENTS/COMPONENTES DE INTERFAZ ---
+# Positions are given on the BASE_WIDTH x BASE_HEIGHT design screen; layout() maps them to the
+# current window, scaled and kept centered (or pinned to the edges named by the anchor).
+# /Las posiciones se dan en la pantalla de diseño BASE_WIDTH x BASE_HEIGHT; layout() las lleva a la
+# ventana actual, escaladas y centradas (o pegadas a los bordes que nombra el ancla).
+
+def scaled(value): # A design length at the current UI scale/Una longitud de diseño a la escala actual
+    return max(1, round(value * config.ui_scale()))
+
+def design_point(x, y, anchor="center"):
+    """Map a design point to the window: relative to the center, or to the edges the anchor names
+    /Llevar un punto de diseño a la ventana: relativo al centro, o a los bordes que nombra el ancla
+    """
+    scale = config.ui_scale()
+    if "left" in anchor:
+        wx = round(x * scale)
+    elif "right" in anchor:
+        wx = config.SCREEN_WIDTH - round((config.BASE_WIDTH - x) * scale)
+    else:
+        wx = config.SCREEN_WIDTH // 2 + round((x - config.BASE_WIDTH / 2) * scale)
+    if anchor.startswith("top"):
+        wy = round(y * scale)
+    elif anchor.startswith("bottom"):
+        wy = config.SCREEN_HEIGHT - round((config.BASE_HEIGHT - y) * scale)
+    else:
+        wy = config.SCREEN_HEIGHT // 2 + round((y - config.BASE_HEIGHT / 2) * scale)
+    return wx, wy
+
 
 class Button: # Main menu buttons and win screen buttons/Botones del menú principal y de la pantalla de victoria
     def __init__(self, x, y, width, height, text_key, action):
-        self.rect = pygame.Rect(x, y, width, height) # The button's rectangle area/El área rectangular del botón
+        self.design = (x, y, width, height) # Rectangle on the design screen/Rectángulo en la pantalla de diseño
+        self.rect = None # The button's rectangle area in the window/El área rectangular del botón en la ventana
         self.text_key = text_key # The key to look up the button's text in the current language/La clave para buscar el texto del botón en el idioma actual
         self.action = action # The function to call when the button is clicked/La función a llamar cuando se hace clic en el botón
         self.color = config.BLUE # Default button color/Color predeterminado del botón
         self.hover_color = config.GREEN # Color when hovered/Color al pasar el mouse por encima
-        self.font = pygame.font.SysFont('Arial', 24, bold=True) # Font for button text/Fuente para el texto del botón
+        self.font = None # Font for button text (family, size, bold)/Fuente para el texto del botón (familia, tamaño, negrita)
         self.text_surf = None # Surface for the button text/Superficie para el texto del botón
         self.text_rect = None # Rectangle for centering the text/Rectángulo para centrar el texto
-        self.update_text() # Initialize the text surface and rectangle/Inicializar la superficie y el rectángulo del texto
+        self.hovered = False # Whether the mouse is over the button/Si el mouse está sobre el botón
+        self.dirty = True # Whether the button must be redrawn/Si el botón debe redibujarse
+        self.layout() # Place it and initialize the text surface/Ubicarlo e inicializar la superficie del texto
+
+    def layout(self): # Place the button for the current window size/Ubicar el botón para el tamaño actual de la ventana
+        x, y, width, height = self.design
+        self.rect = pygame.Rect(design_point(x, y), (scaled(width), scaled(height)))
+        self.font = (config.FONT_FAMILY, scaled(24), True)
+        self.update_text()
 
     def update_text(self): # Update the text surface and rectangle based on the current language/Actualizar la superficie y el rectángulo del texto según el idioma actual
-        text = config.get_text(self.text_key) # Get the button text based on the current language/Obtener el texto del botón según el idioma actual
-        self.text_surf = self.font.render(text, True, config.WHITE) # Render the text surface/Renderizar la superficie del texto
+        self.text_surf = text_cache.get(self.text_key, self.font, config.WHITE) # Text in the current language, rendered once/Texto en el idioma actual, renderizado una vez
         self.text_rect = self.text_surf.get_rect(center=self.rect.center) # Center the text rectangle/Centrar el rectángulo del texto
+        self.dirty = True # New text must be drawn/El nuevo texto debe dibujarse
+
+    def update_hover(self, pos): # Track hover changes so the button is only redrawn when needed/Seguir cambios de hover para redibujar el botón solo cuando sea necesario
+        hovered = self.rect.collidepoint(pos)
+        if hovered != self.hovered:
+            self.hovered = hovered
+            self.dirty = True
 
     def draw(self, screen): # Draw the button on the screen/Dibujar el botón en la pantalla
-        mouse_pos = pygame.mouse.get_pos() # Get the current mouse position/Obtener la posición actual del mouse
-        color = self.hover_color if self.rect.collidepoint(mouse_pos) else self.color # Change color if hovered/Cambiar el color si se pasa el mouse por encima
-        pygame.draw.rect(screen, color, self.rect, border_radius=12) # Draw the button rectangle/Dibujar el rectángulo del botón
-        pygame.draw.rect(screen, config.WHITE, self.rect, 2, border_radius=12) # Draw the button border/Dibujar el borde del botón
+        color = self.hover_color if self.hovered else self.color # Change color if hovered/Cambiar el color si se pasa el mouse por encima
+        pygame.draw.rect(screen, color, self.rect, border_radius=scaled(12)) # Draw the button rectangle/Dibujar el rectángulo del botón
+        pygame.draw.rect(screen, config.WHITE, self.rect, scaled(2), border_radius=scaled(12)) # Draw the button border/Dibujar el borde del botón
         if self.text_surf: # Draw the button text/Dibujar el texto del botón
             screen.blit(self.text_surf, self.text_rect) # Draw the text surface on the button/Dibujar la superficie del texto en el botón
+        self.dirty = False # The button on screen is up to date/El botón en pantalla está actualizado
 
     def handle_event(self, event): # Handle mouse click events to trigger the button action/ Manejar eventos de clic del mouse para activar la acción del botón
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1: # Left mouse button click/ Clic del botón izquierdo del mouse
+        if event.type == pygame.MOUSEMOTION: # Hover changes mark the button dirty/Los cambios de hover marcan el botón como sucio
+            self.update_hover(event.pos)
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1: # Left mouse button click/ Clic del botón izquierdo del mouse
             if self.rect.collidepoint(event.pos): # Check if the click is within the button area/ Verificar si el clic está dentro del área del botón
                 self.action()
 
@@ -40,21 +86,62 @@ class TextLabel: # For displaying static text like the title and win message/Par
         self.text_key = text_key # The key to look up the text in the current language/La clave para buscar el texto en el idioma actual
         self.color = color # Text color/Color del texto
         self.anchor = anchor # Anchor point for positioning the text/ Punto de anclaje para posicionar el texto (e.g., "center", "topleft")
-        self.font = pygame.font.SysFont('Arial', font_size, bold=False) # Font for the text/Fuente para el texto
+        self.font_size = font_size # Size on the design screen/Tamaño en la pantalla de diseño
+        self.font = None # Font for the text (family, size, bold)/Fuente para el texto (familia, tamaño, negrita)
+        self.pos = None # Anchor point in the window/Punto de anclaje en la ventana
         self.image = None # Surface for the rendered text/Superficie para el texto renderizado
         self.rect = None # Rectangle for positioning the text/Rectángulo para posicionar el texto
-        self.update_text() # Initialize the text surface and rectangle/Inicializar la superficie y el rectángulo del texto
+        self.layout() # Place it and initialize the text surface/Ubicarlo e inicializar la superficie del texto
+
+    def layout(self): # Place the text for the current window size/Ubicar el texto para el tamaño actual de la ventana
+        self.pos = design_point(self.x, self.y, self.anchor)
+        self.font = (config.FONT_FAMILY, scaled(self.font_size), False)
+        self.update_text()
 
     def update_text(self): # Update the text surface and rectangle based on the current language/Actualizar la superficie y el rectángulo del texto según el idioma actual
-        text = config.get_text(self.text_key) # Get the text based on the current language/Obtener el texto según el idioma actual
-        self.image = self.font.render(text, True, self.color) # Render the text surface/Renderizar la superficie del texto
-        self.rect = self.image.get_rect(**{self.anchor: (self.x, self.y)}) # Position the text rectangle based on the anchor/Posicionar el rectángulo del texto según el ancla
+        self.image = text_cache.get(self.text_key, self.font, self.color) # Text in the current language, rendered once/Texto en el idioma actual, renderizado una vez
+        self.rect = self.image.get_rect(**{self.anchor: self.pos}) # Position the text rectangle based on the anchor/Posicionar el rectángulo del texto según el ancla
 
     def draw(self, screen): # Draw the text on the screen/Dibujar el texto en la pantalla
         if self.image:
             screen.blit(self.image, self.rect) # Draw the text surface on the screen/Dibujar la superficie del texto en la pantalla
 
 
+class ButtonGroup: # Buttons of one scene behind a spatial index, so events only touch the button under the mouse/Botones de una escena con un índice espacial, para que los eventos solo toquen el botón bajo el mouse
+    def __init__(self, buttons):
+        self.buttons = buttons # Buttons in drawing order/Botones en orden de dibujo
+        self.index = RectIndex() # Maps a position to its button/Convierte una posición en su botón
+        self.hovered = None # Button currently under the mouse/Botón actualmente bajo el mouse
+        self.rebuild()
+
+    def rebuild(self): # Re-index the buttons after they move/Volver a indexar los botones después de moverlos
+        self.index.clear()
+        for btn in self.buttons:
+            self.index.add(btn.rect, btn)
+
+    def sync_hover(self, pos): # Set every button's hover state from the mouse position (before a full redraw)/Fijar el hover de cada botón según la posición del mouse (antes de redibujar todo)
+        self.hovered = self.index.item_at(pos)
+        for btn in self.buttons:
+            btn.update_hover(pos)
+
+    def handle_event(self, event): # Dispatch clicks and hover changes to the button under the mouse/Enviar clics y cambios de hover al botón bajo el mouse
+        if event.type == pygame.MOUSEMOTION:
+            btn = self.index.item_at(event.pos)
+            if btn is not self.hovered: # Only the buttons entered or left change/Solo cambian los botones en los que se entra o se sale
+                if self.hovered is not None:
+                    self.hovered.update_hover(event.pos)
+                if btn is not None:
+                    btn.update_hover(event.pos)
+                self.hovered = btn
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1: # Left mouse button click/ Clic del botón izquierdo del mouse
+            btn = self.index.item_at(event.pos)
+            if btn is not None:
+                btn.action()
+
+    def __iter__(self):
+        return iter(self.buttons)
+
+
 class MainMenu: # The main menu screen with title and buttons/La pantalla del menú principal con título y botones
     def __init__(self, start_cb, lang_cb, exit_cb):
         """
@@ -62,16 +149,17 @@ class MainMenu: # The main menu screen with title and buttons/La pantalla del me
         lang_cb: callback function to change the language/función de callback para cambiar el idioma
         exit_cb: callback function to exit the game/función de callback para salir del juego
         """
-        center_x = config.SCREEN_WIDTH // 2 - 100 # Center the buttons horizontally/Centrar los botones horizontalmente
+        center_x = config.BASE_WIDTH // 2 - 100 # Center the buttons horizontally/Centrar los botones horizontalmente
         
-        self.title = TextLabel(config.SCREEN_WIDTH // 2, 150, 'title', font_size=60, anchor="center") # Title text label/Etiqueta de texto del título
-        self.author = TextLabel(config.SCREEN_WIDTH - 10, config.SCREEN_HEIGHT - 10, 'author', font_size=16, anchor="bottomright") # Author credit in the bottom right corner/Crédito del autor en la esquina inferior derecha
+        self.title = TextLabel(config.BASE_WIDTH // 2, 150, 'title', font_size=60, anchor="center") # Title text label/Etiqueta de texto del título
+        self.author = TextLabel(config.BASE_WIDTH - 10, config.BASE_HEIGHT - 10, 'author', font_size=16, anchor="bottomright") # Author credit in the bottom right corner/Crédito del autor en la esquina inferior derecha
         
         self.buttons = [
             Button(center_x, 250, 200, 50, 'start', start_cb), # Start Game button/Botón de iniciar juego
             Button(center_x, 320, 200, 50, 'Lang', lang_cb), # Language toggle button/Botón de cambio de idioma
             Button(center_x, 390, 200, 50, 'exit', exit_cb) # Exit button/Botón de salir
         ]
+        self.group = ButtonGroup(self.buttons) # Spatial index over the buttons/Índice espacial sobre los botones
 
     def update_language(self): # Update the text for the title, author, and buttons when the language changes/Actualizar el texto del título, autor y botones cuando cambia el idioma
         self.title.update_text() #  Update the title text/Actualizar el texto del título
@@ -79,45 +167,117 @@ class MainMenu: # The main menu screen with title and buttons/La pantalla del me
         for btn in self.buttons: # Update the button text/Actualizar el texto del botón
             btn.update_text() #
 
+    def layout(self): # Place everything again after the window is resized/Ubicar todo de nuevo después de redimensionar la ventana
+        self.title.layout()
+        self.author.layout()
+        for btn in self.buttons:
+            btn.layout()
+        self.group.rebuild()
+
     def handle_event(self, event): # Handle events for the buttons/ Manejar eventos para los botones
-        for btn in self.buttons: #  Check each button to see if it was clicked/Verificar cada botón para ver si fue clickeado
-            btn.handle_event(event)
+        self.group.handle_event(event) # Only the button under the mouse is checked/Solo se revisa el botón bajo el mouse
 
     def draw(self, screen): # Draw the title, author, and buttons on the screen/Dibujar el título, autor y botones en la pantalla
         self.title.draw(screen) # Draw the title/Dibujar el título
         self.author.draw(screen) # Draw the author credit/Dibujar el crédito del autor
+        self.group.sync_hover(pygame.mouse.get_pos()) # The mouse may have moved while another scene was shown/El mouse pudo moverse mientras se mostraba otra escena
         for btn in self.buttons: # Draw each button/Dibujar cada botón
             btn.draw(screen)
 
+    def draw_dirty(self, screen):
+        """Redraw only the buttons that changed and return their rects
+        /Redibujar solo los botones que cambiaron y devolver sus rectángulos
+        """
+        rects = []
+        for btn in self.buttons:
+            if btn.dirty:
+                screen.fill(config.GRAY, btn.rect) # Clear behind the rounded corners/Limpiar detrás de las esquinas redondeadas
+                btn.draw(screen)
+                rects.append(btn.rect)
+        return rects
+
+
+class ModalScene: # A scene shown over a frozen picture of the previous one/Una escena mostrada sobre una imagen congelada de la anterior
+    """Base for modal scenes: freeze() snapshots the screen and darkens it once into an opaque
+    background, so later frames only blit that background and redraw the buttons that changed.
+    /Base para escenas modales: freeze() captura la pantalla y la oscurece una vez en un fondo
+    opaco, así los cuadros siguientes solo copian ese fondo y redibujan los botones que cambiaron.
+    """
+    shade = (0, 0, 0, 180) # Semi-transparent black over the frozen scene/Negro semitransparente sobre la escena congelada
+
+    def __init__(self, buttons):
+        self.buttons = buttons
+        self.group = ButtonGroup(self.buttons) # Spatial index over the buttons/Índice espacial sobre los botones
+        self.background = None # Frozen, shaded snapshot/Captura congelada y sombreada
 
-class WinScreen: # The screen that appears when the player wins, with a message and buttons to restart, go to menu, or exit/La pantalla que aparece cuando el jugador gana, con un mensaje y botones para reiniciar, ir al menú o salir
+    def freeze(self, screen): # Capture what is on the screen now as the background/Capturar lo que hay en pantalla como fondo
+        overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+        overlay.fill(self.shade)
+        background = screen.copy()
+        background.blit(overlay, (0, 0)) # The only alpha blit, done once/La única mezcla alfa, hecha una vez
+        self.background = background.convert() if pygame.display.get_surface() else background # Opaque copy blits fastest/Una copia opaca se copia más rápido
+
+    def unfreeze(self): # Drop the snapshot when the scene is left/Descartar la captura al salir de la escena
+        self.background = None
+
+    def layout(self): # Place the buttons again after the window is resized (then freeze again)/Ubicar los botones de nuevo después de redimensionar (y volver a congelar)
+        for btn in self.buttons:
+            btn.layout()
+        self.group.rebuild()
+        self.background = None
+
+    def handle_event(self, event): # Handle events for the buttons/ Manejar eventos para los botones
+        self.group.handle_event(event) # Only the button under the mouse is checked/Solo se revisa el botón bajo el mouse
+
+    @property
+    def dirty(self): # Whether any button changed since the last draw/Si algún botón cambió desde el último dibujo
+        return any(btn.dirty for btn in self.buttons)
+
+    def draw_content(self, screen): # Static labels drawn over the background, if any/Etiquetas estáticas sobre el fondo, si hay
+        pass
+
+    def draw(self, screen): # Draw the frozen background, the labels and the buttons/Dibujar el fondo congelado, las etiquetas y los botones
+        if self.background is not None:
+            screen.blit(self.background, (0, 0))
+        self.draw_content(screen)
+        self.group.sync_hover(pygame.mouse.get_pos()) # The mouse may have moved while another scene was shown/El mouse pudo moverse mientras se mostraba otra escena
+        for btn in self.buttons:
+            btn.draw(screen)
+
+    def draw_dirty(self, screen):
+        """Redraw only the buttons that changed and return their rects
+        /Redibujar solo los botones que cambiaron y devolver sus rectángulos
+        """
+        rects = []
+        for btn in self.buttons:
+            if btn.dirty:
+                if self.background is not None: # Restore behind the rounded corners/Restaurar detrás de las esquinas redondeadas
+                    screen.blit(self.background, btn.rect, btn.rect)
+                btn.draw(screen)
+                rects.append(btn.rect)
+        return rects
+
+
+class WinScreen(ModalScene): # The screen that appears when the player wins, with a message and buttons to restart, go to menu, or exit/La pantalla que aparece cuando el jugador gana, con un mensaje y botones para reiniciar, ir al menú o salir
     def __init__(self, restart_cb, menu_cb, exit_cb):
-        self.title = TextLabel(config.SCREEN_WIDTH // 2, 250, 'win', font_size=80, color=config.GREEN, anchor="center") # Win message text label/Etiqueta de texto del mensaje de victoria
+        self.title = TextLabel(config.BASE_WIDTH // 2, 250, 'win', font_size=80, color=config.GREEN, anchor="center") # Win message text label/Etiqueta de texto del mensaje de victoria
         
         # Win buttons are arranged horizontally
-        bx = config.SCREEN_WIDTH // 2 # Center X for the buttons/Centro X para los botones
-        self.buttons = [
+        bx = config.BASE_WIDTH // 2 # Center X for the buttons/Centro X para los botones
+        super().__init__([
             Button(bx - 220, 400, 130, 50, 'restart', restart_cb), # Restart button/Botón de reiniciar
             Button(bx - 70, 400, 140, 50, 'main_menu', menu_cb), # Main Menu button/Botón de menú principal
             Button(bx + 90, 400, 130, 50, 'exit', exit_cb) # Exit button/Botón de salir
-        ]
-        
-        # Create a transparent overlay once
-        self.overlay = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT), pygame.SRCALPHA) # Crear una superposición transparente una vez
-        self.overlay.fill((0, 0, 0, 180)) # Fill with semi-transparent black/Rellenar con
+        ])
 
     def update_language(self): # Update the text for the win message and buttons when the language changes/Actualizar el texto del mensaje de victoria y los botones cuando cambia el idioma
         self.title.update_text() # Update the win message text/Actualizar el texto del mensaje de victoria
         for btn in self.buttons: # Update the button text/Actualizar el texto del botón
             btn.update_text()
 
-    def handle_event(self, event): # Handle events for the buttons/ Manejar eventos para los botones
-        for btn in self.buttons: # Check each button to see if it was clicked/Verificar cada botón para ver si fue clickeado
-            btn.handle_event(event)
+    def layout(self):
+        self.title.layout()
+        super().layout()
 
-    def draw(self, screen): # Draw the win message and buttons on the screen/Dibujar el mensaje de victoria y los botones en la pantalla
-        # Draw overlay first
-        screen.blit(self.overlay, (0, 0)) # Draw the semi-transparent overlay/Dibujar la superposición semitransparente
+    def draw_content(self, screen):
         self.title.draw(screen) # Draw the win message/Dibujar el mensaje de victoria
-        for btn in self.buttons: #  Draw each button/Dibujar cada botón
-            btn.draw(screen)
\ No newline at end of file